@@ -12,11 +12,13 @@ High-level data flow (see AGENTS.md for full details):
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-from .researcher import ResearchBundle
-from .validator import ValidationResult
-from .writer import SkillDraft
+if TYPE_CHECKING:
+    from .researcher import ResearchBundle
+    from .validator import ValidationResult
+    from .writer import SkillDraft
 
 
 __all__ = [
@@ -25,3 +27,19 @@ __all__ = [
     "ValidationResult",
 ]
 
+# Re-exports are resolved on first access (PEP 562) so importing e.g.
+# `forge.db` does not pull in every submodule and its SDK dependencies.
+_LAZY_EXPORTS = {
+    "ResearchBundle": ".researcher",
+    "SkillDraft": ".writer",
+    "ValidationResult": ".validator",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
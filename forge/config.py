@@ -0,0 +1,63 @@
+"""Process-wide configuration for Skill Forge.
+
+Environment variables are read once, after loading ``.env``, and cached for
+the lifetime of the process. Call ``config.cache_clear()`` after changing the
+environment (e.g. in tests) to pick up new values.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Final, Optional, Tuple
+
+from dotenv import load_dotenv
+
+
+# Variables the full pipeline needs; checked by `forge.health_check`.
+REQUIRED_ENV_VARS: Final[Tuple[str, ...]] = (
+    "OPENROUTER_API_KEY",
+    "FIRECRAWL_API_KEY",
+    "TELEGRAM_BOT_TOKEN",
+    "TELEGRAM_CHAT_ID",
+    "SUPABASE_URL",
+    "SUPABASE_SERVICE_KEY",
+    "SKILLS_DIR",
+    "DASHBOARD_URL",
+)
+
+
+@dataclass(frozen=True)
+class Config:
+    """Snapshot of the environment variables used by Skill Forge.
+
+    Each field maps to the upper-cased environment variable of the same
+    name. Unset or empty variables are stored as ``None``.
+    """
+
+    openrouter_api_key: Optional[str]
+    firecrawl_api_key: Optional[str]
+    telegram_bot_token: Optional[str]
+    telegram_chat_id: Optional[str]
+    supabase_url: Optional[str]
+    supabase_service_key: Optional[str]
+    skills_dir: Optional[str]
+    dashboard_url: Optional[str]
+    github_token: Optional[str]
+    github_skills_repo: Optional[str]
+    docker_host: Optional[str]
+    skill_forge_concurrency: Optional[str]
+    skill_forge_notifier_sock: Optional[str]
+
+    def get(self, env_name: str) -> Optional[str]:
+        """Return the value for an environment variable name, e.g. ``"SUPABASE_URL"``."""
+        return getattr(self, env_name.lower(), None)
+
+
+@lru_cache(maxsize=1)
+def config() -> Config:
+    """Load ``.env`` once and return the cached configuration snapshot."""
+    load_dotenv()
+    values = {f.name: os.environ.get(f.name.upper()) or None for f in fields(Config)}
+    return Config(**values)
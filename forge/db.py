@@ -5,36 +5,160 @@ Never import or use the Supabase client outside this module.
 
 from __future__ import annotations
 
-import os
+import atexit
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
 from loguru import logger
-from supabase import Client, create_client
+
+from .config import config
+
+if TYPE_CHECKING:
+    from supabase import Client
+
+
+# Process-wide client, reused so HTTP connections stay alive between calls.
+_CLIENT: Client | None = None
+_CLIENT_KEY: Tuple[str, str] | None = None
+_CLIENT_LOCK = threading.Lock()
 
 
 def get_client() -> Client:
-    """Create and return a Supabase client using environment variables."""
-    url = os.environ.get("SUPABASE_URL")
-    key = os.environ.get("SUPABASE_SERVICE_KEY")
+    """Return a cached Supabase client built from the Supabase settings.
+
+    The client is rebuilt only when SUPABASE_URL or SUPABASE_SERVICE_KEY change.
+    """
+    global _CLIENT, _CLIENT_KEY
+
+    cfg = config()
+    url = cfg.supabase_url
+    key = cfg.supabase_service_key
 
     if not url or not key:
         raise RuntimeError(
             "SUPABASE_URL and SUPABASE_SERVICE_KEY environment variables are required."
         )
 
-    return create_client(url, key)
+    client = _CLIENT
+    if client is not None and _CLIENT_KEY == (url, key):
+        return client
 
+    with _CLIENT_LOCK:
+        if _CLIENT is None or _CLIENT_KEY != (url, key):
+            from supabase import create_client  # deferred: heavy SDK import
 
-def insert_event(
+            _CLIENT = create_client(url, key)
+            _CLIENT_KEY = (url, key)
+        return _CLIENT
+
+
+def reset_client() -> None:
+    """Drop the cached Supabase client so the next call builds a fresh one."""
+    global _CLIENT, _CLIENT_KEY
+
+    with _CLIENT_LOCK:
+        _CLIENT = None
+        _CLIENT_KEY = None
+
+
+# Events are coalesced by a background thread into one bulk insert per batch.
+# The learn pipeline buffers its own rows (event_row() / save_skill_and_event());
+# this queue backs insert_event(), kept for one-off events from scripts and
+# other callers that do not own a buffer.
+_EVENT_BATCH_SIZE = 100
+_EVENT_FLUSH_INTERVAL = 0.5
+_EVENT_QUEUE: "queue.Queue[Dict[str, Any] | threading.Event]" = queue.Queue(maxsize=1000)
+_EVENT_THREAD: threading.Thread | None = None
+_EVENT_THREAD_LOCK = threading.Lock()
+
+
+def _write_events(batch: List[Dict[str, Any]]) -> None:
+    """Insert a batch of event rows in a single request."""
+    try:
+        client = get_client()
+        client.table("events").insert(batch).execute()
+        logger.info("Inserted {n} event(s) into Supabase.", n=len(batch))
+    except Exception:
+        # Log, but do not crash the whole agent on transient DB issues.
+        logger.exception("Failed to insert events into Supabase.")
+
+
+def _event_flusher() -> None:
+    """Drain the event queue, writing up to a batch per flush interval.
+
+    A ``threading.Event`` in the queue is a flush marker: everything queued
+    before it is written immediately and the marker is then set.
+    """
+    while True:
+        item = _EVENT_QUEUE.get()
+        batch: List[Dict[str, Any]] = []
+        markers: List[threading.Event] = []
+        deadline = time.monotonic() + _EVENT_FLUSH_INTERVAL
+
+        while True:
+            if isinstance(item, threading.Event):
+                markers.append(item)
+                break
+            batch.append(item)
+            remaining = deadline - time.monotonic()
+            if len(batch) >= _EVENT_BATCH_SIZE or remaining <= 0:
+                break
+            try:
+                item = _EVENT_QUEUE.get(timeout=remaining)
+            except queue.Empty:
+                break
+
+        if batch:
+            _write_events(batch)
+        for marker in markers:
+            marker.set()
+
+
+def _ensure_event_thread() -> None:
+    """Start the background event flusher on first use."""
+    global _EVENT_THREAD
+
+    if _EVENT_THREAD is not None:
+        return
+    with _EVENT_THREAD_LOCK:
+        if _EVENT_THREAD is None:
+            _EVENT_THREAD = threading.Thread(
+                target=_event_flusher, name="forge-db-events", daemon=True
+            )
+            _EVENT_THREAD.start()
+
+
+def flush_events(timeout: float = 10.0) -> None:
+    """Block until all events queued so far have been written (or timeout)."""
+    if _EVENT_THREAD is None:
+        return
+    marker = threading.Event()
+    _EVENT_QUEUE.put(marker)
+    if not marker.wait(timeout):
+        logger.warning("Timed out flushing queued Supabase events.")
+
+
+atexit.register(flush_events)
+
+# Skill writes run here so the pipeline never waits on them; the caller
+# never reads the result and failures are only logged.
+_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="forge-db")
+atexit.register(_EXECUTOR.shutdown, wait=True)
+
+
+def _event_payload(
     event_type: str,
     domain: str = "",
     skill_name: str = "",
     message: str = "",
     metadata: Dict[str, Any] | None = None,
-) -> None:
-    """Insert an event into the Supabase `events` table."""
-    payload: Dict[str, Any] = {
+) -> Dict[str, Any]:
+    """Build an `events` row from insert_event() arguments."""
+    return {
         "event_type": event_type,
         "domain": domain or None,
         "skill_name": skill_name or None,
@@ -42,16 +166,8 @@ def insert_event(
         "metadata": metadata or {},
     }
 
-    try:
-        client = get_client()
-        client.table("events").insert(payload).execute()
-        logger.info("Inserted event into Supabase: {event_type}", event_type=event_type)
-    except Exception:
-        # Log, but do not crash the whole agent on transient DB issues.
-        logger.exception("Failed to insert event into Supabase.")
-
 
-def insert_skill(
+def _skill_payload(
     name: str,
     domain: str,
     category: str,
@@ -60,9 +176,9 @@ def insert_skill(
     validation_passed: bool,
     sources_count: int,
     attempts: int,
-) -> None:
-    """Insert a learned skill into the Supabase `skills` table."""
-    payload: Dict[str, Any] = {
+) -> Dict[str, Any]:
+    """Build a `skills` row from insert_skill() arguments."""
+    return {
         "name": name,
         "domain": domain,
         "category": category,
@@ -73,14 +189,158 @@ def insert_skill(
         "attempts": attempts,
     }
 
+
+def insert_event(
+    event_type: str,
+    domain: str = "",
+    skill_name: str = "",
+    message: str = "",
+    metadata: Dict[str, Any] | None = None,
+) -> None:
+    """Queue an event for insertion into the Supabase `events` table.
+
+    Events are written in batches by a background thread; call
+    ``flush_events()`` to force pending events out.
+    """
+    payload = _event_payload(event_type, domain, skill_name, message, metadata)
+
+    _ensure_event_thread()
+    try:
+        _EVENT_QUEUE.put_nowait(payload)
+    except queue.Full:
+        logger.warning("Event queue full; writing event synchronously: {event_type}", event_type=event_type)
+        _write_events([payload])
+
+
+def event_row(
+    event_type: str,
+    domain: str = "",
+    skill_name: str = "",
+    message: str = "",
+    metadata: Dict[str, Any] | None = None,
+) -> Dict[str, Any]:
+    """Build a timestamped `events` row for a later ``insert_events_bulk()``.
+
+    ``created_at`` is set now, so the row keeps its real time even if it is
+    written later.
+    """
+    row = _event_payload(event_type, domain, skill_name, message, metadata)
+    row["created_at"] = datetime.now(timezone.utc).isoformat()
+    return row
+
+
+def insert_events_bulk(rows: List[Dict[str, Any]]) -> None:
+    """Insert rows built by ``event_row()`` in a single request.
+
+    The write runs on the background executor; failures are only logged.
+    """
+    if not rows:
+        return
+    _EXECUTOR.submit(_write_events, list(rows))
+
+
+def _write_sources(rows: List[Dict[str, Any]]) -> None:
+    """Insert `research_sources` rows in a single request."""
+    try:
+        client = get_client()
+        client.table("research_sources").insert(rows).execute()
+        logger.info("Inserted {n} research source(s) into Supabase.", n=len(rows))
+    except Exception:
+        logger.exception("Failed to insert research sources into Supabase.")
+
+
+def insert_sources_bulk(domain: str, sources: List[str]) -> None:
+    """Record the source URLs of a research run, one row per URL, in one request.
+
+    The write runs on the background executor; failures are only logged.
+    """
+    if not sources:
+        return
+    rows = [{"domain": domain, "url": url} for url in sources]
+    _EXECUTOR.submit(_write_sources, rows)
+
+
+def _write_skill(payload: Dict[str, Any]) -> None:
+    """Insert one `skills` row."""
     try:
         client = get_client()
         client.table("skills").insert(payload).execute()
-        logger.info("Inserted skill into Supabase: {name}", name=name)
+        logger.info("Inserted skill into Supabase: {name}", name=payload["name"])
     except Exception:
         logger.exception("Failed to insert skill into Supabase.")
 
 
+def insert_skill(
+    name: str,
+    domain: str,
+    category: str,
+    description: str,
+    content: str,
+    validation_passed: bool,
+    sources_count: int,
+    attempts: int,
+) -> None:
+    """Insert a learned skill into the Supabase `skills` table in the background."""
+    payload = _skill_payload(
+        name,
+        domain,
+        category,
+        description,
+        content,
+        validation_passed,
+        sources_count,
+        attempts,
+    )
+    _EXECUTOR.submit(_write_skill, payload)
+
+
+def _write_skill_and_event(
+    skill_payload: Dict[str, Any],
+    event_payload: Dict[str, Any],
+    events: List[Dict[str, Any]],
+) -> None:
+    """Write ``events``, then a skill and its event via the `save_skill_with_event()` RPC."""
+    # Keep the live feed in order: earlier events land before the skill.
+    flush_events()
+    if events:
+        _write_events(events)
+
+    try:
+        client = get_client()
+        client.rpc(
+            "save_skill_with_event",
+            {"p_skill": skill_payload, "p_event": event_payload},
+        ).execute()
+        logger.info(
+            "Inserted skill and {event_type} event into Supabase: {name}",
+            event_type=event_payload["event_type"],
+            name=skill_payload["name"],
+        )
+    except Exception:
+        logger.exception("Failed to insert skill and event into Supabase.")
+
+
+def save_skill_and_event(
+    skill: Dict[str, Any],
+    event: Dict[str, Any],
+    events: List[Dict[str, Any]] | None = None,
+) -> None:
+    """Insert a skill and its accompanying event in one round-trip.
+
+    ``skill`` takes the keyword arguments of insert_skill() and ``event``
+    those of insert_event(). Both rows are written in a single transaction
+    by the `save_skill_with_event()` Postgres function, on a background
+    thread. ``events`` are rows from ``event_row()`` that must land before
+    the skill; they are bulk-inserted first, in the same background task.
+    """
+    _EXECUTOR.submit(
+        _write_skill_and_event,
+        _skill_payload(**skill),
+        _event_payload(**event),
+        list(events or []),
+    )
+
+
 def get_stats() -> Dict[str, Any]:
     """Return aggregate statistics about learned skills.
 
@@ -107,33 +367,15 @@ def get_stats() -> Dict[str, Any]:
     domains: List[str] = []
 
     try:
-        # Total skills
-        total_resp = client.table("skills").select("id", count="exact").execute()
-        total = getattr(total_resp, "count", None) or 0
-
-        # Skills created today (UTC)
-        today_start = datetime.now(timezone.utc).date().isoformat() + "T00:00:00Z"
-        today_resp = (
-            client.table("skills")
-            .select("id", count="exact")
-            .gte("created_at", today_start)
-            .execute()
-        )
-        today_count = getattr(today_resp, "count", None) or 0
-
-        # Validation success count
-        success_resp = (
-            client.table("skills")
-            .select("id", count="exact")
-            .eq("validation_passed", True)
-            .execute()
-        )
-        success_count = getattr(success_resp, "count", None) or 0
-
-        # Distinct domains (deduplicated client-side)
-        domains_resp = client.table("skills").select("domain").execute()
-        raw_domains = getattr(domains_resp, "data", []) or []
-        domains = sorted({row.get("domain") for row in raw_domains if row.get("domain")})
+        # Single round-trip. With pg_cron, `skill_stats()` reads the
+        # `mv_skill_forge_stats` view (see supabase/migrations), refreshed
+        # every 5 minutes, so totals may briefly lag.
+        resp = client.rpc("skill_stats").execute()
+        data = getattr(resp, "data", None) or {}
+        total = data.get("total") or 0
+        today_count = data.get("today_count") or 0
+        success_count = data.get("success_count") or 0
+        domains = sorted(d for d in (data.get("domains") or []) if d)
     except Exception:
         logger.exception("Failed to compute stats from Supabase.")
 
@@ -148,3 +390,25 @@ def get_stats() -> Dict[str, Any]:
         "domains": domains,
     }
 
+
+def get_daily_summary(since: str) -> Dict[str, Any]:
+    """Return data for the daily summary in a single round-trip.
+
+    Returns a dictionary with:
+    - total: total number of skills
+    - rows: skills created at or after `since` (ISO timestamp), each with
+      name, description, domain, validation_passed and created_at
+    """
+    try:
+        client = get_client()
+        # Computed by the `get_daily_summary()` Postgres function (see supabase/migrations).
+        resp = client.rpc("get_daily_summary", {"since": since}).execute()
+        data = getattr(resp, "data", None) or {}
+    except Exception:
+        logger.exception("Failed to fetch daily summary from Supabase.")
+        data = {}
+
+    return {
+        "total": int(data.get("total") or 0),
+        "rows": list(data.get("todays_rows") or []),
+    }
@@ -10,39 +10,76 @@ Verifies environment configuration and connectivity to external services:
 from __future__ import annotations
 
 import os
+import socket
 import subprocess
-from typing import Dict, List, Tuple
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
-from dotenv import load_dotenv
-from firecrawl import FirecrawlApp
 from loguru import logger
 from rich.console import Console
 from rich.table import Table
 
+from .config import REQUIRED_ENV_VARS, config
 from .db import get_client
 
 
 console = Console()
 
+_DEFAULT_DOCKER_SOCKET = "/var/run/docker.sock"
+_DOCKER_CHECK_TTL_SECONDS = 30.0
+_docker_check_cache: Optional[Tuple[float, Tuple[bool, str]]] = None
+
 
 def _check_env_vars() -> Tuple[bool, List[str]]:
   """Check that all required environment variables are present."""
-  required = [
-      "OPENROUTER_API_KEY",
-      "FIRECRAWL_API_KEY",
-      "TELEGRAM_BOT_TOKEN",
-      "TELEGRAM_CHAT_ID",
-      "SUPABASE_URL",
-      "SUPABASE_SERVICE_KEY",
-      "SKILLS_DIR",
-      "DASHBOARD_URL",
-  ]
-  missing = [name for name in required if not os.environ.get(name)]
+  cfg = config()
+  missing = [name for name in REQUIRED_ENV_VARS if not cfg.get(name)]
   return len(missing) == 0, missing
 
 
+def _docker_socket_path() -> Optional[str]:
+  """Return the local Docker daemon socket path, or None if not a unix socket."""
+  host = config().docker_host
+  if host:
+      return host[len("unix://"):] if host.startswith("unix://") else None
+  if not hasattr(socket, "AF_UNIX") or not os.path.exists(_DEFAULT_DOCKER_SOCKET):
+      return None
+  return _DEFAULT_DOCKER_SOCKET
+
+
+def _check_docker_socket(path: str) -> bool:
+  """Return True if the Docker daemon accepts connections on its unix socket."""
+  try:
+      with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+          sock.settimeout(1.0)
+          sock.connect(path)
+      return True
+  except OSError:
+      return False
+
+
 def _check_docker() -> Tuple[bool, str]:
-  """Check that Docker CLI is available and responsive."""
+  """Check that the Docker daemon is reachable, caching the result briefly."""
+  global _docker_check_cache
+
+  now = time.monotonic()
+  if _docker_check_cache is not None and now - _docker_check_cache[0] < _DOCKER_CHECK_TTL_SECONDS:
+      return _docker_check_cache[1]
+
+  result = _probe_docker()
+  _docker_check_cache = (now, result)
+  return result
+
+
+def _probe_docker() -> Tuple[bool, str]:
+  """Connect to the daemon socket, falling back to the Docker CLI."""
+  # A socket connect is far cheaper than `docker version` and answers the
+  # same question: is the daemon up? The CLI covers Windows and TCP hosts.
+  path = _docker_socket_path()
+  if path and _check_docker_socket(path):
+      return True, f"Docker daemon socket reachable at {path}"
+
   try:
       completed = subprocess.run(
           ["docker", "version", "--format", "{{.Server.Version}}"],
@@ -79,11 +116,13 @@ def _check_supabase() -> Tuple[bool, str]:
 
 def _check_firecrawl() -> Tuple[bool, str]:
   """Check that Firecrawl API key is present and client can be constructed."""
-  api_key = os.environ.get("FIRECRAWL_API_KEY")
+  api_key = config().firecrawl_api_key
   if not api_key:
       return False, "FIRECRAWL_API_KEY not set."
 
   try:
+      from firecrawl import FirecrawlApp
+
       # Constructing the client validates the key format; we avoid a full network call.
       _ = FirecrawlApp(api_key=api_key)
   except Exception as exc:  # noqa: BLE001
@@ -94,10 +133,17 @@ def _check_firecrawl() -> Tuple[bool, str]:
 
 
 def run_health_check() -> Dict[str, Dict[str, str]]:
-  """Run all health checks and return structured results."""
+  """Run all health checks concurrently and return structured results."""
   results: Dict[str, Dict[str, str]] = {}
 
-  env_ok, missing = _check_env_vars()
+  # The probes are independent and mostly wait on I/O, so run them together.
+  with ThreadPoolExecutor(max_workers=4, thread_name_prefix="forge-health") as pool:
+      env_future = pool.submit(_check_env_vars)
+      docker_future = pool.submit(_check_docker)
+      supabase_future = pool.submit(_check_supabase)
+      firecrawl_future = pool.submit(_check_firecrawl)
+
+  env_ok, missing = env_future.result()
   results["env"] = {
       "status": "ok" if env_ok else "error",
       "details": "All required env vars present."
@@ -105,19 +151,19 @@ def run_health_check() -> Dict[str, Dict[str, str]]:
       else f"Missing env vars: {', '.join(missing)}",
   }
 
-  docker_ok, docker_details = _check_docker()
+  docker_ok, docker_details = docker_future.result()
   results["docker"] = {
       "status": "ok" if docker_ok else "error",
       "details": docker_details,
   }
 
-  supabase_ok, supabase_details = _check_supabase()
+  supabase_ok, supabase_details = supabase_future.result()
   results["supabase"] = {
       "status": "ok" if supabase_ok else "error",
       "details": supabase_details,
   }
 
-  firecrawl_ok, firecrawl_details = _check_firecrawl()
+  firecrawl_ok, firecrawl_details = firecrawl_future.result()
   results["firecrawl"] = {
       "status": "ok" if firecrawl_ok else "error",
       "details": firecrawl_details,
@@ -128,7 +174,6 @@ def run_health_check() -> Dict[str, Dict[str, str]]:
 
 def main() -> int:
   """CLI entry point for health checks."""
-  load_dotenv()
   results = run_health_check()
 
   table = Table(title="Skill Forge Health Check", show_header=True, header_style="bold magenta")
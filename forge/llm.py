@@ -6,55 +6,121 @@ OpenRouter via the OpenAI Python SDK.
 
 from __future__ import annotations
 
-import os
-from typing import Final
+import atexit
+import threading
+from typing import TYPE_CHECKING, Dict, Final, Iterator, Tuple
 
 from loguru import logger
-from openai import OpenAI
+
+from .config import config
+
+if TYPE_CHECKING:
+    from openai import OpenAI
 
 BASE_URL: Final[str] = "https://openrouter.ai/api/v1"
 DEFAULT_MODEL: Final[str] = "anthropic/claude-sonnet-4"
 
+# One client (and httpx connection pool) per (base_url, api_key).
+_CLIENTS: Dict[Tuple[str, str], OpenAI] = {}
+_CLIENTS_LOCK = threading.Lock()
 
-def llm_call(user_prompt: str, system_prompt: str, model: str = DEFAULT_MODEL) -> str:
-    """Execute a single LLM chat completion and return the response text.
 
-    Parameters
-    ----------
-    user_prompt:
-        The user-facing portion of the prompt.
-    system_prompt:
-        The system message describing behavior and constraints.
-    model:
-        The OpenRouter model identifier to use.
+def _get_client(api_key: str) -> OpenAI:
+    """Return a cached OpenAI client for OpenRouter, creating it on first use."""
+    key = (BASE_URL, api_key)
+    client = _CLIENTS.get(key)
+    if client is not None:
+        return client
+
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(key)
+        if client is None:
+            # Deferred: the OpenAI SDK is only needed once an LLM call is made.
+            import httpx
+            from openai import DefaultHttpxClient, OpenAI
+
+            client = OpenAI(
+                base_url=BASE_URL,
+                api_key=api_key,
+                # Keeps the SDK's own client defaults (timeouts, redirects).
+                http_client=DefaultHttpxClient(
+                    limits=httpx.Limits(max_keepalive_connections=10),
+                ),
+            )
+            _CLIENTS[key] = client
+        return client
+
+
+def _close_clients() -> None:
+    """Close cached clients and their pooled connections at exit."""
+    with _CLIENTS_LOCK:
+        clients = list(_CLIENTS.values())
+        _CLIENTS.clear()
+    for client in clients:
+        try:
+            client.close()
+        except Exception:  # noqa: BLE001
+            logger.debug("Failed to close OpenAI client.")
+
+
+atexit.register(_close_clients)
+
+
+def llm_call_stream(
+    user_prompt: str, system_prompt: str, model: str = DEFAULT_MODEL
+) -> Iterator[str]:
+    """Stream a single LLM chat completion, yielding text deltas as they arrive.
+
+    Lets callers start processing the response before the full completion
+    has been generated. Parameters are the same as for ``llm_call``.
     """
-    api_key = os.environ.get("OPENROUTER_API_KEY")
+    api_key = config().openrouter_api_key
     if not api_key:
         raise RuntimeError("OPENROUTER_API_KEY environment variable is not set.")
 
-    client = OpenAI(base_url=BASE_URL, api_key=api_key)
+    client = _get_client(api_key)
 
     try:
-        response = client.chat.completions.create(
+        stream = client.chat.completions.create(
             model=model,
             messages=[
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt},
             ],
+            stream=True,
         )
     except Exception:
         logger.exception("LLM call failed.")
         raise
 
     try:
-        content = response.choices[0].message.content
+        for chunk in stream:
+            # The final chunk may carry only usage data and no choices.
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
     except Exception:
-        logger.exception("Unexpected response structure from LLM.")
+        logger.exception("LLM stream failed.")
         raise
 
-    if content is None:
+
+def llm_call(user_prompt: str, system_prompt: str, model: str = DEFAULT_MODEL) -> str:
+    """Execute a single LLM chat completion and return the response text.
+
+    Parameters
+    ----------
+    user_prompt:
+        The user-facing portion of the prompt.
+    system_prompt:
+        The system message describing behavior and constraints.
+    model:
+        The OpenRouter model identifier to use.
+    """
+    content = "".join(llm_call_stream(user_prompt, system_prompt, model))
+
+    if not content:
         logger.error("LLM returned empty content.")
-        return ""
 
     return content
-
@@ -7,14 +7,23 @@ skill-learning pipeline.
 from __future__ import annotations
 
 import asyncio
+import atexit
 import html
-import os
-from typing import Any, Dict
+import json
+import socket
+import string
+import threading
+from collections import deque
+from concurrent.futures import Future, wait
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Set, Tuple
 
 from loguru import logger
-from dotenv import load_dotenv
-from telegram import Bot
-from telegram.constants import ParseMode
+
+from .config import config
+
+if TYPE_CHECKING:
+    from telegram import Bot
 
 
 # HTML-formatted templates — much simpler than MarkdownV2 since only
@@ -57,19 +66,79 @@ _EVENT_TEMPLATES: Dict[str, str] = {
     "saved": NOTIF_SAVED,
 }
 
+# Placeholder names per template, parsed once so only used values get escaped.
+_EVENT_FIELDS: Dict[str, Tuple[str, ...]] = {
+    event: tuple(
+        dict.fromkeys(
+            field for _, field, _, _ in string.Formatter().parse(template) if field
+        )
+    )
+    for event, template in _EVENT_TEMPLATES.items()
+}
+
+
+# A single Bot and event loop are kept for the whole process so the Bot's
+# HTTP session (bound to the loop it first ran on) is reused across messages.
+_BOT: Bot | None = None
+_LOOP: asyncio.AbstractEventLoop | None = None
+_LOOP_THREAD: threading.Thread | None = None
+_LOOP_LOCK = threading.Lock()
+_PENDING: Set[Future[None]] = set()
+
+# Messages scheduled close together are sent as one Telegram message: the
+# drainer waits _BATCH_WINDOW, then joins up to _BATCH_MAX queued messages
+# (within Telegram's length limit). Only touched on the notifier loop.
+_BATCH_WINDOW = 0.2
+_BATCH_MAX = 32
+_MAX_MESSAGE_CHARS = 4096
+_BATCH_SEPARATOR = "\n\n"
+_OUTBOX: Deque[Tuple[str, "asyncio.Future[None]"]] = deque()
+_DRAINER: asyncio.Task[None] | None = None
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the notifier event loop, starting its background thread on first use."""
+    global _LOOP, _LOOP_THREAD
+
+    if _LOOP is not None:
+        return _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            loop = asyncio.new_event_loop()
+            _LOOP_THREAD = threading.Thread(
+                target=loop.run_forever, name="forge-notifier", daemon=True
+            )
+            _LOOP_THREAD.start()
+            _LOOP = loop
+        return _LOOP
+
+
+def _get_bot(token: str) -> Bot:
+    """Return the cached Bot for this token; only called on the notifier loop."""
+    global _BOT
+
+    if _BOT is None or _BOT.token != token:
+        from telegram import Bot  # deferred: heavy SDK import
+
+        _BOT = Bot(token=token)
+    return _BOT
+
 
 def _get_telegram_credentials() -> tuple[str | None, str | None]:
-    # Load .env once so running `python -m forge.notifier` from the project root
-    # picks up TELEGRAM_* values without extra shell configuration.
-    load_dotenv()
-    token = os.environ.get("TELEGRAM_BOT_TOKEN")
-    chat_id = os.environ.get("TELEGRAM_CHAT_ID")
-    return token, chat_id
+    # config() loads .env once, so running `python -m forge.notifier` from the
+    # project root picks up TELEGRAM_* values without extra shell configuration.
+    cfg = config()
+    return cfg.telegram_bot_token, cfg.telegram_chat_id
 
 
+@lru_cache(maxsize=1024)
 def _escape_html(text: str) -> str:
-    """Escape text for safe embedding in Telegram HTML messages."""
-    return html.escape(str(text))
+    """Escape text for safe embedding in Telegram HTML messages.
+
+    Memoized: the same domain and skill name are escaped for every event of
+    a pipeline run. Callers must pass ``str`` so cache keys stay uniform.
+    """
+    return html.escape(text)
 
 
 async def _send_telegram(text: str) -> None:
@@ -82,7 +151,9 @@ async def _send_telegram(text: str) -> None:
         )
         return
 
-    bot = Bot(token=token)
+    from telegram.constants import ParseMode
+
+    bot = _get_bot(token)
 
     try:
         await bot.send_message(
@@ -104,7 +175,81 @@ async def _send_telegram(text: str) -> None:
         logger.exception("Failed to send Telegram message as plain text.")
 
 
-def _build_message(event: str, **kwargs: Any) -> str:
+def _take_batch() -> List[Tuple[str, "asyncio.Future[None]"]]:
+    """Pop the next run of queued messages that fits in one Telegram message."""
+    batch = [_OUTBOX.popleft()]
+    length = len(batch[0][0])
+    while _OUTBOX and len(batch) < _BATCH_MAX:
+        extra = len(_BATCH_SEPARATOR) + len(_OUTBOX[0][0])
+        if length + extra > _MAX_MESSAGE_CHARS:
+            break
+        batch.append(_OUTBOX.popleft())
+        length += extra
+    return batch
+
+
+async def _drain_outbox() -> None:
+    """Send queued messages in order, coalescing those that arrive together."""
+    while _OUTBOX:
+        await asyncio.sleep(_BATCH_WINDOW)
+        batch = _take_batch()
+        try:
+            await _send_telegram(_BATCH_SEPARATOR.join(text for text, _ in batch))
+        finally:
+            for _, done in batch:
+                if not done.done():
+                    done.set_result(None)
+
+
+async def _send_batched(text: str) -> None:
+    """Queue a message for the drainer and wait until its batch is sent."""
+    global _DRAINER
+
+    done: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+    _OUTBOX.append((text, done))
+    if _DRAINER is None or _DRAINER.done():
+        _DRAINER = asyncio.ensure_future(_drain_outbox())
+    await done
+
+
+def _on_sent(future: Future[None]) -> None:
+    """Forget a finished send and log anything that escaped _send_telegram."""
+    _PENDING.discard(future)
+    if future.cancelled():
+        logger.warning("Telegram notification was cancelled before it was sent.")
+        return
+    exc = future.exception()
+    if exc is not None:
+        logger.opt(exception=exc).error("Telegram notification failed.")
+
+
+def dispatch(text: str) -> None:
+    """Schedule a Telegram message on the notifier loop without blocking.
+
+    This is the only send path, so it behaves the same whether the caller is
+    plain synchronous code or is itself running inside an event loop.
+    """
+    future = asyncio.run_coroutine_threadsafe(_send_batched(text), _get_loop())
+    _PENDING.add(future)
+    future.add_done_callback(_on_sent)
+
+
+def flush_notifications(timeout: float = 10.0) -> None:
+    """Block until all scheduled notifications have been sent (or timeout)."""
+    pending = _PENDING.copy()
+    if not pending:
+        return
+    _, not_done = wait(pending, timeout=timeout)
+    if not_done:
+        logger.warning(
+            "Timed out waiting for {n} Telegram notification(s).", n=len(not_done)
+        )
+
+
+atexit.register(flush_notifications)
+
+
+def build_message(event: str, **kwargs: Any) -> str:
     """Build a notification message from the event name and keyword arguments."""
     template = _EVENT_TEMPLATES.get(event)
     if not template:
@@ -113,13 +258,9 @@ def _build_message(event: str, **kwargs: Any) -> str:
             return _escape_html(str(custom_message))
         return f"Skill Forge event: {_escape_html(event)}"
 
-    # Escape all interpolated values for HTML.
-    escaped_kwargs: Dict[str, Any] = {
-        key: _escape_html(value) for key, value in kwargs.items()
-    }
-
+    # Escape only the values the template interpolates.
     try:
-        return template.format(**escaped_kwargs)
+        escaped = {field: _escape_html(str(kwargs[field])) for field in _EVENT_FIELDS[event]}
     except KeyError as exc:
         logger.error(
             "Missing format argument {exc} for notification event '{event}'. "
@@ -129,22 +270,55 @@ def _build_message(event: str, **kwargs: Any) -> str:
         )
         return template
 
+    return template.format_map(escaped)
+
+
+# Datagram socket for handing events to scripts/notify_daemon.py.
+_DAEMON_SOCK: socket.socket | None = None
+_DAEMON_SOCK_LOCK = threading.Lock()
+
+
+def _send_to_daemon(path: str, event: str, kwargs: Dict[str, Any]) -> bool:
+    """Hand an event to the notifier daemon without blocking.
+
+    Returns False if the daemon cannot take it (not running, socket buffer
+    full, or no Unix socket support), so the caller can send it directly.
+    """
+    global _DAEMON_SOCK
+
+    family = getattr(socket, "AF_UNIX", None)
+    if family is None:
+        return False
+    try:
+        with _DAEMON_SOCK_LOCK:
+            if _DAEMON_SOCK is None:
+                sock = socket.socket(family, socket.SOCK_DGRAM)
+                sock.setblocking(False)
+                _DAEMON_SOCK = sock
+        payload = json.dumps({"event": event, "kwargs": kwargs}, default=str)
+        _DAEMON_SOCK.sendto(payload.encode("utf-8"), path)
+        return True
+    except OSError as exc:
+        logger.debug("Notifier daemon unavailable ({exc}); sending directly.", exc=exc)
+        return False
+
 
 def notify(event: str, **kwargs: Any) -> None:
     """Format and send a notification for the given event.
 
     This is a synchronous convenience wrapper around the async Telegram
-    client, making it easy to call from the rest of the agent code.
+    client, making it easy to call from the rest of the agent code. The
+    message is sent on a background event loop, batched with any others
+    scheduled within ``_BATCH_WINDOW``; pending messages are flushed at
+    interpreter exit. When ``SKILL_FORGE_NOTIFIER_SOCK`` is set, the event
+    is handed to the notifier daemon instead (see scripts/notify_daemon.py).
     """
-    message = _build_message(event, **kwargs)
-    try:
-        asyncio.run(_send_telegram(message))
-    except RuntimeError:
-        # If already in an event loop, schedule the coroutine instead of running it.
-        logger.warning(
-            "Event loop already running; scheduling Telegram notification coroutine."
-        )
-        asyncio.create_task(_send_telegram(message))
+    sock_path = config().skill_forge_notifier_sock
+    if sock_path and _send_to_daemon(sock_path, event, kwargs):
+        return
+
+    message = build_message(event, **kwargs)
+    dispatch(message)
 
 
 def send_daily_summary(stats: Dict[str, Any]) -> None:
@@ -174,13 +348,7 @@ def send_daily_summary(stats: Dict[str, Any]) -> None:
         dashboard_url=_escape_html(str(dashboard_url)),
     )
 
-    try:
-        asyncio.run(_send_telegram(message))
-    except RuntimeError:
-        logger.warning(
-            "Event loop already running; scheduling daily summary notification coroutine."
-        )
-        asyncio.create_task(_send_telegram(message))
+    dispatch(message)
 
 
 if __name__ == "__main__":
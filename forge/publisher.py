@@ -13,24 +13,55 @@ Setup
 
 The publisher uses the GitHub Contents API — no git installation required.
 Each skill is written to ``skills/<skill-name>/SKILL.md`` in the repo.
+``publish_skills_bulk`` uses the Git Data API instead, committing many
+skills in a single commit with a fixed number of requests.
 """
 
 from __future__ import annotations
 
+import atexit
 import base64
-import os
-from typing import Optional
+import json
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .config import config
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is used otherwise
+    orjson = None  # type: ignore[assignment]
 
 
 _GITHUB_API = "https://api.github.com"
+_BRANCH = "main"
+
+# Shared session so requests to api.github.com reuse pooled keep-alive
+# connections; transient gateway errors are retried with backoff.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+    ),
+)
+atexit.register(_SESSION.close)
+
+# Blob SHA of each (repo, path) as last seen on GitHub, so updates can skip
+# the GET. Keyed by repo too, since GITHUB_SKILLS_REPO is re-read per call.
+_SHA_CACHE: Dict[Tuple[str, str], str] = {}
 
 
 def _get_credentials() -> tuple[str, str] | tuple[None, None]:
-    token = os.environ.get("GITHUB_TOKEN")
-    repo = os.environ.get("GITHUB_SKILLS_REPO")
+    cfg = config()
+    token = cfg.github_token
+    repo = cfg.github_skills_repo
     if not token or not repo:
         return None, None
     return token, repo
@@ -41,18 +72,43 @@ def _get_headers(token: str) -> dict:
         "Authorization": f"Bearer {token}",
         "Accept": "application/vnd.github+json",
         "X-GitHub-Api-Version": "2022-11-28",
+        "Content-Type": "application/json",
     }
 
 
-def _get_existing_sha(token: str, repo: str, path: str) -> Optional[str]:
+def _json_body(payload: Any) -> bytes:
+    """Encode a request body; SKILL.md contents make these payloads large."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, allow_nan=False).encode("utf-8")
+
+
+def _get_existing_sha(headers: dict, repo: str, path: str) -> Optional[str]:
     """Return the blob SHA of an existing file, or None if it doesn't exist."""
     url = f"{_GITHUB_API}/repos/{repo}/contents/{path}"
-    resp = requests.get(url, headers=_get_headers(token), timeout=15)
+    resp = _SESSION.get(url, headers=headers, timeout=15)
     if resp.status_code == 200:
         return resp.json().get("sha")
     return None
 
 
+def _skill_path(skill_name: str) -> str:
+    return f"skills/{skill_name}/SKILL.md"
+
+
+def _public_url(repo: str, path: str) -> str:
+    return f"https://github.com/{repo}/blob/{_BRANCH}/{path}"
+
+
+def _log_http_error(skill_name: str, exc: requests.HTTPError) -> None:
+    logger.error(
+        "GitHub publish failed for '{name}': {status} — {body}",
+        name=skill_name,
+        status=exc.response.status_code if exc.response is not None else "?",
+        body=exc.response.text[:300] if exc.response is not None else str(exc),
+    )
+
+
 def publish_skill(skill_name: str, skill_content: str) -> Optional[str]:
     """Push a SKILL.md to the configured GitHub skills repo.
 
@@ -74,14 +130,17 @@ def publish_skill(skill_name: str, skill_content: str) -> Optional[str]:
         )
         return None
 
-    path = f"skills/{skill_name}/SKILL.md"
+    headers = _get_headers(token)
+    path = _skill_path(skill_name)
     url = f"{_GITHUB_API}/repos/{repo}/contents/{path}"
 
     # Encode content as base64 (required by GitHub Contents API).
     encoded = base64.b64encode(skill_content.encode("utf-8")).decode("ascii")
 
     # Check if the file already exists so we can update rather than create.
-    existing_sha = _get_existing_sha(token, repo, path)
+    # A cached SHA from an earlier publish saves the lookup request.
+    cached_sha = _SHA_CACHE.get((repo, path))
+    existing_sha = cached_sha or _get_existing_sha(headers, repo, path)
 
     payload: dict = {
         "message": f"skill-forge: publish {skill_name}",
@@ -94,20 +153,118 @@ def publish_skill(skill_name: str, skill_content: str) -> Optional[str]:
         action = "Created"
 
     try:
-        resp = requests.put(url, json=payload, headers=_get_headers(token), timeout=30)
+        resp = _SESSION.put(url, data=_json_body(payload), headers=headers, timeout=30)
+        if cached_sha and resp.status_code in (409, 422):
+            # The cached SHA is stale (file changed elsewhere); look it up and retry.
+            _SHA_CACHE.pop((repo, path), None)
+            fresh_sha = _get_existing_sha(headers, repo, path)
+            if fresh_sha:
+                payload["sha"] = fresh_sha
+            else:
+                payload.pop("sha", None)
+                action = "Created"
+            resp = _SESSION.put(url, data=_json_body(payload), headers=headers, timeout=30)
         resp.raise_for_status()
     except requests.HTTPError as exc:
-        logger.error(
-            "GitHub publish failed for '{name}': {status} — {body}",
-            name=skill_name,
-            status=exc.response.status_code if exc.response else "?",
-            body=exc.response.text[:300] if exc.response else str(exc),
-        )
+        _log_http_error(skill_name, exc)
         return None
     except Exception as exc:
         logger.error("GitHub publish error for '{name}': {exc}", name=skill_name, exc=exc)
         return None
 
-    public_url = f"https://github.com/{repo}/blob/main/{path}"
+    try:
+        new_sha = resp.json()["content"]["sha"]
+    except Exception:
+        new_sha = None
+    if new_sha:
+        _SHA_CACHE[(repo, path)] = new_sha
+
+    public_url = _public_url(repo, path)
     logger.info("{action} skill '{name}' on GitHub: {url}", action=action, name=skill_name, url=public_url)
     return public_url
+
+
+def publish_skills_bulk(skills: List[Tuple[str, str]]) -> List[str]:
+    """Push many SKILL.md files to the skills repo in a single commit.
+
+    Uses the Git Data API (ref → commit → tree → commit → ref), so the number
+    of requests is constant regardless of how many skills are published.
+
+    Parameters
+    ----------
+    skills:
+        ``(skill_name, skill_content)`` pairs.
+
+    Returns
+    -------
+    Public GitHub URLs of the published skills, or an empty list on failure.
+    """
+    token, repo = _get_credentials()
+    if not token or not repo:
+        logger.warning(
+            "GITHUB_TOKEN or GITHUB_SKILLS_REPO not set — skipping publish."
+        )
+        return []
+    if not skills:
+        return []
+
+    headers = _get_headers(token)
+    base = f"{_GITHUB_API}/repos/{repo}/git"
+    paths = [_skill_path(name) for name, _ in skills]
+    label = f"{len(skills)} skills"
+
+    try:
+        ref_resp = _SESSION.get(f"{base}/ref/heads/{_BRANCH}", headers=headers, timeout=15)
+        ref_resp.raise_for_status()
+        parent_sha = ref_resp.json()["object"]["sha"]
+
+        commit_resp = _SESSION.get(f"{base}/commits/{parent_sha}", headers=headers, timeout=15)
+        commit_resp.raise_for_status()
+        base_tree = commit_resp.json()["tree"]["sha"]
+
+        tree_resp = _SESSION.post(
+            f"{base}/trees",
+            data=_json_body({
+                "base_tree": base_tree,
+                "tree": [
+                    {"path": path, "mode": "100644", "type": "blob", "content": content}
+                    for path, (_, content) in zip(paths, skills)
+                ],
+            }),
+            headers=headers,
+            timeout=60,
+        )
+        tree_resp.raise_for_status()
+
+        new_commit_resp = _SESSION.post(
+            f"{base}/commits",
+            data=_json_body({
+                "message": f"skill-forge: publish {label}",
+                "tree": tree_resp.json()["sha"],
+                "parents": [parent_sha],
+            }),
+            headers=headers,
+            timeout=30,
+        )
+        new_commit_resp.raise_for_status()
+
+        update_resp = _SESSION.patch(
+            f"{base}/refs/heads/{_BRANCH}",
+            data=_json_body({"sha": new_commit_resp.json()["sha"]}),
+            headers=headers,
+            timeout=30,
+        )
+        update_resp.raise_for_status()
+    except requests.HTTPError as exc:
+        _log_http_error(label, exc)
+        return []
+    except Exception as exc:
+        logger.error("GitHub publish error for '{name}': {exc}", name=label, exc=exc)
+        return []
+
+    # Blob SHAs changed; let the next single publish look them up again.
+    for path in paths:
+        _SHA_CACHE.pop((repo, path), None)
+
+    logger.info("Published {n} skills to GitHub in one commit.", n=len(skills))
+    return [_public_url(repo, path) for path in paths]
@@ -10,31 +10,69 @@ Strategy
 3. If an official docs site is detected among results, crawl up to
    `max_crawl_pages` pages from it for deeper coverage.
 4. Fall back to search snippets for any URL that cannot be scraped.
+
+Finished research is cached on disk under ``~/.cache/skill_forge/research``
+for a day, so relearning a domain skips the network.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import os
 import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
-from typing import Any, List, Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
 
-from firecrawl import FirecrawlApp
 from loguru import logger
 
+from .config import config
+
+if TYPE_CHECKING:
+    from firecrawl import FirecrawlApp
+
 
 # Patterns that identify official documentation sites worth crawling.
+# Host-label patterns are anchored with \b so only whole labels match
+# (``docs.python.org`` but not ``mydocs.example``), which also lets the
+# regex engine skip most start positions.
 _DOCS_URL_PATTERNS = [
-    r"docs\.",
+    r"\bdocs\.",
     r"/docs/",
-    r"documentation\.",
+    r"\bdocumentation\.",
     r"readthedocs\.io",
     r"\.dev/docs",
-    r"learn\.",
-    r"guide\.",
+    r"\blearn\.",
+    r"\bguide\.",
 ]
 
-_DOCS_PATTERN = re.compile("|".join(_DOCS_URL_PATTERNS), re.IGNORECASE)
+_DOCS_PATTERN = re.compile("(?:" + "|".join(_DOCS_URL_PATTERNS) + ")", re.IGNORECASE)
+
+# Hosts that never serve a project's own docs, so no /docs/ URL is derived from them.
+_SKIP_RE = re.compile(
+    r"wikipedia\.org|github\.com|youtube\.com|reddit\.com|linkedin\.com"
+)
+
+# Maximum characters kept from any single scraped page or search snippet.
+_PAGE_CHAR_LIMIT = 4000
+
+# Separator placed between blocks in ResearchBundle.notes.
+_NOTES_SEPARATOR = "\n\n---\n\n"
+
+# Upper bound on how long research waits for any single scrape or crawl.
+_FETCH_TIMEOUT_SECONDS = 120
+
+# Finished research is reused from disk for a day; bump the version when the
+# bundle format or collection strategy changes to invalidate old entries.
+_RESEARCH_CACHE_DIR = Path.home() / ".cache" / "skill_forge" / "research"
+_RESEARCH_CACHE_TTL_SECONDS = 86400
+_RESEARCH_CACHE_VERSION = 1
 
 
 @dataclass
@@ -44,17 +82,37 @@ class ResearchBundle:
     domain: str
     sources: List[str]
     notes: str
+    # True when the bundle came from the on-disk cache rather than a fresh run.
+    cached: bool = False
+
+
+_APP: FirecrawlApp | None = None
+_APP_KEY: str | None = None
+_APP_LOCK = threading.Lock()
 
 
 def _get_firecrawl_app() -> FirecrawlApp:
-    """Instantiate a FirecrawlApp using the FIRECRAWL_API_KEY environment variable."""
-    api_key = os.environ.get("FIRECRAWL_API_KEY")
+    """Return a cached FirecrawlApp for the FIRECRAWL_API_KEY environment variable."""
+    global _APP, _APP_KEY
+
+    api_key = config().firecrawl_api_key
     if not api_key:
         raise RuntimeError("FIRECRAWL_API_KEY environment variable is required for research.")
-    return FirecrawlApp(api_key=api_key)
 
+    app = _APP
+    if app is not None and _APP_KEY == api_key:
+        return app
+
+    with _APP_LOCK:
+        if _APP is None or _APP_KEY != api_key:
+            from firecrawl import FirecrawlApp  # deferred: heavy SDK import
+
+            _APP = FirecrawlApp(api_key=api_key)
+            _APP_KEY = api_key
+        return _APP
 
-def _scrape_url(app: FirecrawlApp, url: str, char_limit: int = 4000) -> str:
+
+def _scrape_url(app: FirecrawlApp, url: str, char_limit: int = _PAGE_CHAR_LIMIT) -> str:
     """Scrape a single URL and return its markdown content, or empty string on failure."""
     try:
         result = app.scrape(url)
@@ -113,26 +171,77 @@ def _crawl_docs_site(
     return blocks
 
 
+def _append_block(parts: List[str], *pieces: str) -> None:
+    """Append one notes block to a flat list of string pieces.
+
+    Notes are joined once at the end, so page content is copied a single
+    time instead of first into a per-block string and again into the notes.
+    """
+    if parts:
+        parts.append(_NOTES_SEPARATOR)
+    parts.extend(pieces)
+
+
 def _find_docs_url(sources: List[str]) -> Optional[str]:
     """Return the best docs URL from sources, or derive one from the official domain."""
-    # Prefer an explicit docs URL first.
+    # Single pass: an explicit docs URL wins outright; otherwise fall back to
+    # <scheme>://<host>/docs/ of the first non-Wikipedia/GitHub source.
+    derived: Optional[str] = None
     for url in sources:
         if _DOCS_PATTERN.search(url):
             return url
+        if derived is None and not _SKIP_RE.search(url):
+            parsed = urlparse(url)
+            if parsed.scheme and parsed.netloc:
+                derived = f"{parsed.scheme}://{parsed.netloc}/docs/"
+
+    return derived
+
+
+def _research_cache_path(domain: str, **params: int) -> Path:
+    """Return the cache file for a domain and the research parameters."""
+    key_source = json.dumps(
+        {
+            "v": _RESEARCH_CACHE_VERSION,
+            "domain": domain,
+            "page_char_limit": _PAGE_CHAR_LIMIT,
+            **params,
+        },
+        sort_keys=True,
+    )
+    key = hashlib.blake2b(key_source.encode("utf-8"), digest_size=16).hexdigest()
+    return _RESEARCH_CACHE_DIR / f"{key}.json"
 
-    # Fall back: for the first non-Wikipedia/GitHub source, try appending /docs/
-    skip_domains = ("wikipedia.org", "github.com", "youtube.com", "reddit.com", "linkedin.com")
-    for url in sources:
-        if any(d in url for d in skip_domains):
-            continue
-        # Try <scheme>://<host>/docs/ as the docs entry point.
-        from urllib.parse import urlparse
-        parsed = urlparse(url)
-        if parsed.scheme and parsed.netloc:
-            derived = f"{parsed.scheme}://{parsed.netloc}/docs/"
-            return derived
 
-    return None
+def _load_cached_research(path: Path) -> Optional[ResearchBundle]:
+    """Return the cached bundle at path if it exists and is fresh."""
+    try:
+        if time.time() - path.stat().st_mtime > _RESEARCH_CACHE_TTL_SECONDS:
+            return None
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return ResearchBundle(
+            domain=data["domain"],
+            sources=list(data["sources"]),
+            notes=data["notes"],
+            cached=True,
+        )
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logger.warning("Ignoring unreadable research cache entry: {path}", path=path)
+        return None
+
+
+def _store_cached_research(path: Path, bundle: ResearchBundle) -> None:
+    """Write a bundle to the cache atomically; failures are only logged."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        data = {"domain": bundle.domain, "sources": bundle.sources, "notes": bundle.notes}
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError:
+        logger.warning("Could not write research cache entry: {path}", path=path)
 
 
 def research_domain(
@@ -140,6 +249,37 @@ def research_domain(
     max_results: int = 5,
     max_scrape: int = 3,
     max_crawl_pages: int = 5,
+    use_cache: bool = True,
+) -> ResearchBundle:
+    """Research a domain, reusing a result cached on disk within the last day.
+
+    Parameters are as for ``_research_domain_uncached``; pass
+    ``use_cache=False`` to always fetch fresh research. Only research that
+    found at least one source is cached; a cache hit has ``cached`` set.
+    """
+    cache_path = _research_cache_path(
+        domain,
+        max_results=max_results,
+        max_scrape=max_scrape,
+        max_crawl_pages=max_crawl_pages,
+    )
+    if use_cache:
+        cached = _load_cached_research(cache_path)
+        if cached is not None:
+            logger.info("Using cached research for domain: {domain}", domain=domain)
+            return cached
+
+    bundle = _research_domain_uncached(domain, max_results, max_scrape, max_crawl_pages)
+    if bundle.sources:
+        _store_cached_research(cache_path, bundle)
+    return bundle
+
+
+def _research_domain_uncached(
+    domain: str,
+    max_results: int = 5,
+    max_scrape: int = 3,
+    max_crawl_pages: int = 5,
 ) -> ResearchBundle:
     """Research a domain using Firecrawl search + full-page scraping + doc crawling.
 
@@ -164,7 +304,8 @@ def research_domain(
         raise
 
     sources: List[str] = []
-    notes_blocks: List[str] = []
+    seen_sources: set[str] = set()
+    notes_parts: List[str] = []
 
     # Normalise across all Firecrawl SDK response shapes.
     web_results: List[Any] = []
@@ -177,7 +318,9 @@ def research_domain(
     elif isinstance(raw, list):
         web_results = raw[:max_results]
 
-    for idx, item in enumerate(web_results):
+    # First pass: collect URLs, titles and snippets so fetches can start together.
+    entries: List[Tuple[str, str, str]] = []
+    for item in web_results:
         if hasattr(item, "url"):
             url = item.url or ""
             snippet = getattr(item, "description", "") or ""
@@ -195,34 +338,66 @@ def research_domain(
         else:
             continue
 
-        if url and url not in sources:
+        if url and url not in seen_sources:
+            seen_sources.add(url)
             sources.append(str(url))
+        # Some SDK versions return full page markdown as the "snippet"; cap it
+        # like a scraped page so notes stay bounded as max_results grows.
+        entries.append((url, str(snippet)[:_PAGE_CHAR_LIMIT], title))
 
-        # Fully scrape the first `max_scrape` results for rich content.
-        if idx < max_scrape and url:
-            logger.info("Scraping full page ({i}/{n}): {url}", i=idx + 1, n=max_scrape, url=url)
-            full_content = _scrape_url(app, url)
-            content = full_content if full_content else snippet
-        else:
-            content = snippet
+    docs_url = _find_docs_url(sources)
+
+    # Fully scrape the first `max_scrape` results, and crawl the docs site,
+    # concurrently — all of these calls are network-bound.
+    pool = ThreadPoolExecutor(max_workers=max_scrape + 1)
+    try:
+        scrape_futures: Dict[int, Future[str]] = {}
+        for idx, (url, _snippet, _title) in enumerate(entries):
+            if idx < max_scrape and url:
+                logger.info(
+                    "Scraping full page ({i}/{n}): {url}", i=idx + 1, n=max_scrape, url=url
+                )
+                scrape_futures[idx] = pool.submit(_scrape_url, app, url)
+
+        crawl_future: Optional[Future[List[str]]] = None
+        if docs_url:
+            crawl_future = pool.submit(
+                _crawl_docs_site, app, docs_url, max_pages=max_crawl_pages
+            )
 
-        if content:
-            header = f"# {title}\n{url}" if title else f"# Source: {url}"
-            notes_blocks.append(f"{header}\n\n{content}")
+        for idx, (url, snippet, title) in enumerate(entries):
+            content = snippet
+            future = scrape_futures.get(idx)
+            if future is not None:
+                try:
+                    content = future.result(timeout=_FETCH_TIMEOUT_SECONDS) or snippet
+                except FutureTimeoutError:
+                    logger.warning("Timed out scraping URL: {url}", url=url)
 
-    # Deep crawl the official docs site if one was found in results.
-    docs_url = _find_docs_url(sources)
-    if docs_url:
-        crawled = _crawl_docs_site(app, docs_url, max_pages=max_crawl_pages)
-        notes_blocks.extend(crawled)
-        logger.info(
-            "Added {n} crawled doc pages for domain: {domain}", n=len(crawled), domain=domain
-        )
+            if content:
+                header = f"# {title}\n{url}" if title else f"# Source: {url}"
+                _append_block(notes_parts, header, "\n\n", content)
+
+        # Deep crawl the official docs site if one was found in results.
+        if crawl_future is not None:
+            try:
+                crawled = crawl_future.result(timeout=_FETCH_TIMEOUT_SECONDS)
+            except FutureTimeoutError:
+                logger.warning("Timed out crawling docs site: {url}", url=docs_url)
+                crawled = []
+            for block in crawled:
+                _append_block(notes_parts, block)
+            logger.info(
+                "Added {n} crawled doc pages for domain: {domain}", n=len(crawled), domain=domain
+            )
+    finally:
+        # Don't block on fetches that already timed out.
+        pool.shutdown(wait=False, cancel_futures=True)
 
     if not web_results:
-        notes_blocks.append(str(raw))
+        _append_block(notes_parts, str(raw))
 
-    combined_notes = "\n\n---\n\n".join(notes_blocks) if notes_blocks else ""
+    combined_notes = "".join(notes_parts)
 
     bundle = ResearchBundle(domain=domain, sources=sources, notes=combined_notes)
     logger.info(
@@ -6,25 +6,75 @@ Handles reading from and writing to the Hermes skills directory
 
 from __future__ import annotations
 
+import atexit
 import os
 import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
+import yaml
 from loguru import logger
-from yaml import safe_load
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+from .config import config
 from .writer import SkillDraft
 
 
 def _skills_root(override: str | None = None) -> Path:
     """Return the root directory where skills are stored."""
-    base = override or os.environ.get("SKILLS_DIR") or os.path.expanduser("~/.hermes/skills")
+    base = override or config().skills_dir or os.path.expanduser("~/.hermes/skills")
     root = Path(base).expanduser()
     root.mkdir(parents=True, exist_ok=True)
     return root
 
 
+# Directories that never contain skills; pruned without descending into them.
+_SKIP_DIRS = frozenset({".git", "node_modules", "__pycache__"})
+
+
+def _iter_skill_md(root: Path | str, skip_hidden: bool = False) -> Iterator[str]:
+    """Yield the path of every SKILL.md under root.
+
+    Walks with ``os.scandir`` using an explicit stack, pruning ``.git`` and
+    similar directories (and, with ``skip_hidden``, every dot-directory) up
+    front rather than filtering paths afterwards. Symlinked directories are
+    not followed.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in _SKIP_DIRS and not (
+                                skip_hidden and entry.name.startswith(".")
+                            ):
+                                stack.append(entry.path)
+                        elif entry.name == "SKILL.md":
+                            yield entry.path
+                    except OSError:
+                        continue
+        except OSError:
+            logger.warning("Cannot scan skills directory: {}", directory)
+
+
+def _iter_skill_dirs(root: Path | str, skip_hidden: bool = False) -> Iterator[Path]:
+    """Yield each directory under root that contains a SKILL.md."""
+    for skill_md in _iter_skill_md(root, skip_hidden=skip_hidden):
+        yield Path(os.path.dirname(skill_md))
+
+
+_FENCE_LINE_RE = re.compile(r"^[ \t]*```", re.MULTILINE)
+
+
 def _unwrap_code_fence(text: str) -> str:
     """If content is wrapped in a ``` fenced block, unwrap it.
 
@@ -32,38 +82,328 @@ def _unwrap_code_fence(text: str) -> str:
     helper strips the outer fence so the file starts directly with YAML
     frontmatter, while still enforcing that the frontmatter itself is valid.
     """
-    lines = text.splitlines()
-    if not lines:
+    nl = text.find("\n")
+    if nl < 0 or not text[:nl].strip().startswith("```"):
         return text
 
-    first = lines[0].strip()
-    if not first.startswith("```"):
+    # Find closing fence.
+    close = _FENCE_LINE_RE.search(text, nl + 1)
+    if close is None:
         return text
 
-    # Find closing fence.
-    for idx in range(1, len(lines)):
-        if lines[idx].strip().startswith("```"):
-            inner = "\n".join(lines[1:idx])
-            rest = "\n".join(lines[idx + 1 :])
-            combined = inner
-            if rest.strip():
-                combined = inner + "\n" + rest
-            return combined.lstrip("\n")
+    inner = text[nl + 1 : max(nl + 1, close.start() - 1)]
+    rest_nl = text.find("\n", close.end())
+    rest = text[rest_nl + 1 :] if rest_nl >= 0 else ""
+    combined = inner
+    if rest.strip():
+        combined = inner + "\n" + rest
+    return combined.lstrip("\n")
+
+
+# Frontmatter fields read by list_skills()/save_skill() and the scripts.
+# _fast_frontmatter_fields() extracts exactly these; anything else needs PyYAML.
+_FAST_FIELDS: frozenset[Tuple[str, ...]] = frozenset(
+    {
+        ("name",),
+        ("description",),
+        ("metadata", "skill_forge", "domain"),
+        ("metadata", "skill_forge", "validation_passed"),
+        ("metadata", "hermes", "category"),
+    }
+)
+_BOOL_FIELDS = frozenset({("metadata", "skill_forge", "validation_passed")})
+
+_FM_KEY_RE = re.compile(r"^( *)([\w][\w-]*):(?: +(.*))?$")
+_FM_LIST_ITEM_RE = re.compile(r"^ *- +\S")
+# List items that are nested mappings or non-plain scalars.
+_FM_COMPLEX_ITEM_RE = re.compile(r":(?: |$)|^- *[|>\[{&*!\"']")
+# PyYAML's own implicit resolver decides what type a plain scalar has, so
+# the fast path agrees with it on dates, sexagesimal ints, ``.inf``, etc.
+_RESOLVER = yaml.resolver.Resolver()
+_STR_TAG = "tag:yaml.org,2002:str"
+_BOOL_TAG = "tag:yaml.org,2002:bool"
+# Tags whose construction can fail (bad dates) or that SafeLoader rejects
+# outright (``=`` and ``<<`` as values).
+_UNSAFE_TAGS = frozenset(
+    {
+        "tag:yaml.org,2002:timestamp",
+        "tag:yaml.org,2002:value",
+        "tag:yaml.org,2002:merge",
+    }
+)
+
+
+class _NeedsYaml(Exception):
+    """Raised when frontmatter uses syntax the fast extractor doesn't handle."""
+
+
+# Characters that cannot start a plain scalar, or start one the fast path
+# doesn't handle (block/flow collections, anchors, tags, directives, ...).
+_UNSAFE_FIRST = "|>[]{}&*!%@`#,?:-"
+# A ": " or trailing ":" makes a plain scalar an (invalid) nested mapping.
+_PLAIN_COLON_RE = re.compile(r":(?:\s|$)")
+
+
+def _plain_scalar(value: str) -> str:
+    """Validate a stripped plain scalar and drop any trailing comment."""
+    if value[:1] in _UNSAFE_FIRST or _PLAIN_COLON_RE.search(value):
+        raise _NeedsYaml
+    if " #" in value:
+        value = value.split(" #", 1)[0].rstrip()
+    if _scalar_tag(value) in _UNSAFE_TAGS:
+        raise _NeedsYaml
+    return value
+
+
+def _scalar_tag(value: str) -> str:
+    """Return the tag PyYAML resolves a plain scalar to."""
+    return _RESOLVER.resolve(yaml.ScalarNode, value, (True, False))
+
+
+def _fast_scalar(raw: str, as_bool: bool) -> Any:
+    """Parse a simple one-line YAML scalar, or raise _NeedsYaml."""
+    value = raw.strip()
+    if value[:1] == '"':
+        if len(value) < 2 or not value.endswith('"') or "\\" in value or '"' in value[1:-1]:
+            raise _NeedsYaml
+        return value[1:-1]
+    if value[:1] == "'":
+        inner = value[1:-1]
+        if len(value) < 2 or not value.endswith("'") or "'" in inner.replace("''", ""):
+            raise _NeedsYaml
+        return inner.replace("''", "'")
+    value = _plain_scalar(value)
+    tag = _scalar_tag(value)
+    if as_bool and tag == _BOOL_TAG:
+        return yaml.constructor.SafeConstructor.bool_values[value.lower()]
+    if tag != _STR_TAG:
+        raise _NeedsYaml
+    return value
+
+
+def _check_skipped_value(raw: str) -> None:
+    """Raise _NeedsYaml unless an ignored value is a simple one-line scalar or list.
+
+    Values of keys the fast path doesn't return must still be valid YAML, or
+    the fast path would accept frontmatter that PyYAML rejects.
+    """
+    value = raw.strip()
+    if value[:1] == "[":
+        # Simple flow list of plain items, e.g. ``tags: [a, b]``.
+        flow = value.split(" #", 1)[0].rstrip()
+        if not flow.endswith("]"):
+            raise _NeedsYaml
+        items = flow[1:-1].split(",")
+        if items and not items[-1].strip():
+            items.pop()  # trailing comma
+        for item in items:
+            item = item.strip()
+            if not item or any(c in item for c in "[]{}\"'#") or item.endswith(":"):
+                raise _NeedsYaml
+            _plain_scalar(item)
+        return
+    if value[:1] in "\"'":
+        _fast_scalar(value, as_bool=False)
+    else:
+        _plain_scalar(value)
 
-    return text
 
+class _Level:
+    """An open mapping key while scanning frontmatter (see below)."""
 
-def _parse_frontmatter(path: Path) -> Dict[str, Any]:
-    """Parse YAML frontmatter from a SKILL.md file."""
+    __slots__ = ("indent", "key", "child_indent", "has_list", "seen")
+
+    def __init__(self, indent: int, key: str) -> None:
+        self.indent = indent
+        self.key = key
+        self.child_indent: Optional[int] = None  # indent of its nested keys
+        self.has_list = False  # owns a block sequence instead of keys
+        self.seen: Set[str] = set()  # nested keys so far; duplicates go to YAML
+
+
+def _fast_frontmatter_fields(text: str) -> Optional[Dict[str, Any]]:
+    """Extract the common frontmatter fields without invoking PyYAML.
+
+    Handles the block-style ``key: value`` layout Skill Forge writes. Only
+    the fields in ``_FAST_FIELDS`` are returned, nested as YAML would nest
+    them. Returns None when the frontmatter uses anything else (block or
+    flow scalars, multi-line values, anchors, tabs, inconsistent
+    indentation, duplicate keys, scalars PyYAML would not load as strings
+    (or as a bool, for ``validation_passed``), ...) so callers can fall back
+    to a full YAML parse. Accepted frontmatter is checked against
+    ``yaml.safe_load`` in tests/test_skill_manager_frontmatter.py.
+    """
+    result: Dict[str, Any] = {}
+    root = _Level(-1, "")
+    root.child_indent = 0
+    stack: List[_Level] = [root]
+    opened: Optional[_Level] = None  # key opened on the previous line, if any
+    list_indent: Optional[int] = None  # indent of the list items being skipped
+    saw_key = False
     try:
-        text = path.read_text(encoding="utf-8")
-    except Exception:
-        logger.exception("Failed to read SKILL.md at %s", path)
-        return {}
+        for line in text.split("\n"):
+            line = line.rstrip("\r")
+            stripped = line.strip()
+            if not stripped or stripped.startswith("#"):
+                continue
+            if "\t" in line:
+                # PyYAML rejects tabs in indentation and after plain scalars
+                # (even before a comment); leave any tab to it.
+                raise _NeedsYaml
+            indent = len(line) - len(line.lstrip(" "))
+            match = _FM_KEY_RE.match(line)
+            if match is None:
+                # Simple list items (e.g. tags) directly under their key are
+                # skipped; anything else is unknown.
+                if not _FM_LIST_ITEM_RE.match(line) or _FM_COMPLEX_ITEM_RE.search(stripped):
+                    raise _NeedsYaml
+                if list_indent is None:
+                    if opened is None or indent < opened.indent:
+                        raise _NeedsYaml
+                    opened.has_list = True
+                    list_indent = indent
+                elif indent != list_indent:
+                    raise _NeedsYaml
+                _check_skipped_value(stripped[1:])
+                opened = None
+                continue
+            saw_key = True
+            list_indent = None
+            opened = None
+            key = match.group(2)
+            raw = match.group(3)
+            while stack[-1].indent >= indent:
+                stack.pop()
+            parent = stack[-1]
+            if parent.has_list:
+                raise _NeedsYaml
+            if parent.child_indent is None:
+                parent.child_indent = indent
+            elif parent.child_indent != indent:
+                raise _NeedsYaml
+            if key in parent.seen:
+                raise _NeedsYaml
+            parent.seen.add(key)
+            path = tuple(level.key for level in stack[1:]) + (key,)
+            if raw is None or not raw.strip() or raw.lstrip().startswith("#"):
+                if path in _FAST_FIELDS:
+                    # Empty, or a nested block where a scalar field is expected.
+                    raise _NeedsYaml
+                opened = _Level(indent, key)
+                stack.append(opened)
+                continue
+            if path not in _FAST_FIELDS:
+                _check_skipped_value(raw)
+                continue
+            value = _fast_scalar(raw, as_bool=path in _BOOL_FIELDS)
+            target = result
+            for part in path[:-1]:
+                target = target.setdefault(part, {})
+                if not isinstance(target, dict):
+                    raise _NeedsYaml
+            target[path[-1]] = value
+    except _NeedsYaml:
+        return None
+    if saw_key and not result:
+        # Only unknown keys: let YAML return them so the mapping isn't mistaken for empty.
+        return None
+    return result
+
+
+def _load_frontmatter(frontmatter: str) -> Any:
+    """Parse a frontmatter block: fast path first, libyaml/PyYAML as fallback."""
+    fields = _fast_frontmatter_fields(frontmatter)
+    if fields is not None:
+        return fields
+    return yaml.load(frontmatter, Loader=_SafeLoader)
+
+
+def _read_frontmatter_bytes(path: Path | str, chunk_size: int = 4096) -> bytes:
+    """Read a SKILL.md only as far as the end of its frontmatter.
+
+    Returns the bytes up to and including the closing ``---`` line. If the
+    first line is not ``---`` only that line is returned, and if no closing
+    line exists the whole file is returned, so the caller can report why
+    parsing failed. The Markdown body is never read.
+    """
+    buf = bytearray()
+    scan_from = -1  # start of the next unscanned line once the opener is confirmed
+    with open(path, "rb") as fh:
+        while True:
+            chunk = fh.read(chunk_size)
+            if not chunk:
+                return bytes(buf)
+            buf += chunk
+            if scan_from < 0:
+                nl = buf.find(b"\n")
+                if nl < 0:
+                    continue
+                if buf[:nl].strip() != b"---":
+                    return bytes(buf[: nl + 1])
+                scan_from = nl + 1
+            while True:
+                nl = buf.find(b"\n", scan_from)
+                if nl < 0:
+                    break
+                if buf[scan_from:nl].strip() == b"---":
+                    return bytes(buf[: nl + 1])
+                scan_from = nl + 1
+
+
+def _frontmatter_bounds(content: str) -> Optional[Tuple[int, int]]:
+    """Return the ``(start, end)`` slice between the ``---`` lines, or None.
+
+    Locates the delimiters with ``str.find`` so the body is never split.
+    """
+    nl = content.find("\n")
+    if nl < 0 or content[:nl].strip() != "---":
+        return None
+    start = pos = nl + 1
+    while pos < len(content):
+        nl = content.find("\n", pos)
+        end = len(content) if nl < 0 else nl
+        if content[pos:end].strip() == "---":
+            return start, max(start, pos - 1)
+        pos = end + 1
+    return None
+
+
+def _frontmatter_text(content: str) -> Optional[str]:
+    """Return the text between the opening and closing ``---`` lines, or None."""
+    bounds = _frontmatter_bounds(content)
+    if bounds is None:
+        return None
+    return content[bounds[0] : bounds[1]]
+
+
+# Top-level `name:` only; nested keys such as metadata.author.name are left alone.
+_NAME_LINE_RE = re.compile(r"^name[ \t]*:.*$", re.MULTILINE)
+
+
+def _set_frontmatter_name(content: str, name: str) -> str:
+    """Set the frontmatter ``name:`` to ``name`` (agentskills.io spec).
+
+    Only the first top-level ``name:`` line inside the frontmatter is
+    rewritten; content without frontmatter is returned unchanged.
+    """
+    bounds = _frontmatter_bounds(content)
+    if bounds is None:
+        return content
+    start, end = bounds
+    frontmatter = _NAME_LINE_RE.sub(lambda _m: f"name: {name}", content[start:end], count=1)
+    return content[:start] + frontmatter + content[end:]
+
+
+def _parse_frontmatter_text(text: str, source: str = "SKILL.md content") -> Dict[str, Any]:
+    """Parse YAML frontmatter from SKILL.md text already in memory.
 
+    Well-formed frontmatter takes the fast path and only yields the fields
+    in ``_FAST_FIELDS``; anything else is parsed in full with YAML.
+    ``source`` names the text in log messages.
+    """
     lines = text.splitlines()
     if not lines or lines[0].strip() != "---":
-        logger.error("SKILL.md at %s is missing YAML frontmatter start delimiter.", path)
+        logger.error("{} is missing YAML frontmatter start delimiter.", source)
         return {}
 
     end_idx = None
@@ -73,30 +413,74 @@ def _parse_frontmatter(path: Path) -> Dict[str, Any]:
             break
 
     if end_idx is None:
-        logger.error("SKILL.md at %s is missing YAML frontmatter end delimiter.", path)
+        logger.error("{} is missing YAML frontmatter end delimiter.", source)
         return {}
 
     frontmatter = "\n".join(lines[1:end_idx])
     try:
-        data = safe_load(frontmatter) or {}
+        data = _load_frontmatter(frontmatter) or {}
     except Exception:
-        logger.exception("Failed to parse YAML frontmatter for %s", path)
+        logger.exception("Failed to parse YAML frontmatter for {}", source)
         return {}
 
     if not isinstance(data, dict):
-        logger.error("Frontmatter in %s is not a mapping.", path)
+        logger.error("Frontmatter in {} is not a mapping.", source)
         return {}
 
     return data
 
 
+def _parse_frontmatter(path: Path) -> Dict[str, Any]:
+    """Parse YAML frontmatter from a SKILL.md file, reading only the frontmatter."""
+    try:
+        text = _read_frontmatter_bytes(path).decode("utf-8")
+    except Exception:
+        logger.exception("Failed to read SKILL.md at {}", path)
+        return {}
+
+    return _parse_frontmatter_text(text, f"SKILL.md at {path}")
+
+
+# Used by _sanitize_frontmatter().
+_INLINE_LIST_RE = re.compile(r"^(\s*)([\w][\w-]*):\s*\[(.+)\]\s*$")
+_KEY_RE = re.compile(r"^([\w][\w-]*):")
+# Top-level fields not allowed by the spec.
+_DISALLOWED_TOP_LEVEL = frozenset({"version"})
+# Cheap precheck for _sanitize_frontmatter(): a line that _KEY_RE would flag
+# as a disallowed top-level key.
+_DISALLOWED_KEY_RE = re.compile(
+    r"^(?! )[^\S\n]*(?:%s):" % "|".join(map(re.escape, sorted(_DISALLOWED_TOP_LEVEL))),
+    re.MULTILINE,
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_frontmatter_cached(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Memoized _parse_frontmatter keyed on the file's identity and stat.
+
+    ``mtime_ns`` and ``size`` are only part of the cache key: editing the
+    file changes them and forces a re-parse. The returned dict is shared
+    between calls and must not be mutated.
+    """
+    return _parse_frontmatter(Path(path_str))
+
+
 def _sanitize_frontmatter(content: str) -> str:
     """Sanitize YAML frontmatter to comply with agentskills.io spec.
 
     Changes applied inside the frontmatter block only:
     1. Convert inline flow sequences  tags: [a, b]  →  block style
     2. Remove top-level `version:` field (not in spec — belongs in metadata)
+
+    Content that needs neither change is returned as-is.
     """
+    bounds = _frontmatter_bounds(content)
+    if bounds is None:
+        return content
+    frontmatter = content[bounds[0] : bounds[1]]
+    if "[" not in frontmatter and not _DISALLOWED_KEY_RE.search(frontmatter):
+        return content
+
     lines = content.splitlines()
     if not lines or lines[0].strip() != "---":
         return content
@@ -109,10 +493,6 @@ def _sanitize_frontmatter(content: str) -> str:
     if end_idx is None:
         return content
 
-    _inline_list_re = re.compile(r"^(\s*)([\w][\w-]*):\s*\[(.+)\]\s*$")
-    # Top-level fields not allowed by the spec.
-    _disallowed_top_level = {"version"}
-
     new_lines = []
     skip_next = False
     for i, line in enumerate(lines):
@@ -122,11 +502,11 @@ def _sanitize_frontmatter(content: str) -> str:
         if 0 < i < end_idx:
             # Strip disallowed top-level keys (no leading spaces = top-level).
             stripped = line.strip()
-            key_match = re.match(r"^([\w][\w-]*):", stripped)
-            if key_match and not line.startswith(" ") and key_match.group(1) in _disallowed_top_level:
+            key_match = _KEY_RE.match(stripped)
+            if key_match and not line.startswith(" ") and key_match.group(1) in _DISALLOWED_TOP_LEVEL:
                 continue
             # Convert inline lists to block style.
-            m = _inline_list_re.match(line)
+            m = _INLINE_LIST_RE.match(line)
             if m:
                 indent = m.group(1)
                 key = m.group(2)
@@ -152,6 +532,28 @@ def _spec_validate(skill_dir: Path) -> list[str]:
         return [f"skills-ref error: {exc}"]
 
 
+# skills-ref validation runs off the save path; pending checks finish at exit.
+_VALIDATION_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="forge-spec")
+atexit.register(_VALIDATION_POOL.shutdown, wait=True)
+
+
+def _log_spec_validation(name: str, future: Future) -> None:
+    """Done callback for a background `_spec_validate` run."""
+    try:
+        errors = future.result()
+    except Exception:
+        logger.exception("skills-ref spec validation crashed for '{}'", name)
+        return
+    if errors:
+        logger.warning(
+            "skills-ref spec validation warnings for '{}': {}",
+            name,
+            "; ".join(errors),
+        )
+    else:
+        logger.info("skills-ref spec validation passed for '{}'", name)
+
+
 def save_skill(draft: SkillDraft, skills_dir: str | None = None) -> Path:
     """Persist a SkillDraft into the Hermes skills directory as SKILL.md.
 
@@ -159,17 +561,15 @@ def save_skill(draft: SkillDraft, skills_dir: str | None = None) -> Path:
     - Valid YAML frontmatter with a non-empty `name` field
     - name matches the directory name (agentskills.io spec)
     - No inline YAML arrays (converted to block style for strictyaml compat)
-    - Passes skills-ref spec validation after writing
+    - skills-ref spec validation after writing (runs in the background;
+      results are logged)
     """
     root = _skills_root(skills_dir)
     content = _unwrap_code_fence(draft.content)
     content = _sanitize_frontmatter(content)
 
     # Parse frontmatter to get the skill name.
-    tmp_path = root / "__tmp_validation__.md"
-    tmp_path.write_text(content, encoding="utf-8")
-    meta = _parse_frontmatter(tmp_path)
-    tmp_path.unlink(missing_ok=True)
+    meta = _parse_frontmatter_text(content, f"SKILL.md draft '{draft.name}'")
 
     name = meta.get("name")
     if not isinstance(name, str) or not name.strip():
@@ -185,18 +585,11 @@ def save_skill(draft: SkillDraft, skills_dir: str | None = None) -> Path:
     skill_path = skill_dir / "SKILL.md"
     skill_path.write_text(content, encoding="utf-8")
 
-    # Run official spec validation.
-    errors = _spec_validate(skill_dir)
-    if errors:
-        logger.warning(
-            "skills-ref spec validation warnings for '{}': {}",
-            safe_name,
-            "; ".join(errors),
-        )
-    else:
-        logger.info("skills-ref spec validation passed for '{}'", safe_name)
+    # Run official spec validation without blocking the caller.
+    future = _VALIDATION_POOL.submit(_spec_validate, skill_dir)
+    future.add_done_callback(partial(_log_spec_validation, safe_name))
 
-    logger.info("Saved SKILL.md for '%s' at %s", safe_name, skill_path)
+    logger.info("Saved SKILL.md for '{}' at {}", safe_name, skill_path)
     return skill_path
 
 
@@ -205,8 +598,25 @@ def list_skills(skills_dir: str | None = None) -> List[Dict[str, Any]]:
     root = _skills_root(skills_dir)
     skills: List[Dict[str, Any]] = []
 
-    for skill_md in root.rglob("SKILL.md"):
-        meta = _parse_frontmatter(skill_md)
+    paths: List[str] = []
+    mtimes: List[int] = []
+    sizes: List[int] = []
+    for skill_md_path in _iter_skill_md(root):
+        try:
+            st = os.stat(skill_md_path)
+        except OSError:
+            continue
+        paths.append(skill_md_path)
+        mtimes.append(st.st_mtime_ns)
+        sizes.append(st.st_size)
+
+    # Frontmatter reads are small and I/O-bound; overlap them across threads.
+    # map() keeps results in path order.
+    workers = min(32, (os.cpu_count() or 1) * 4, max(1, len(paths)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        metas = list(pool.map(_parse_frontmatter_cached, paths, mtimes, sizes))
+
+    for skill_md_path, meta in zip(paths, metas):
         if not meta:
             continue
         metadata = meta.get("metadata") or {}
@@ -219,7 +629,7 @@ def list_skills(skills_dir: str | None = None) -> List[Dict[str, Any]]:
                 "domain": skill_forge_meta.get("domain"),
                 "category": hermes_meta.get("category"),
                 "validation_passed": skill_forge_meta.get("validation_passed", False),
-                "path": str(skill_md),
+                "path": skill_md_path,
             }
         )
 
@@ -230,17 +640,20 @@ def get_local_stats(skills_dir: str | None = None) -> Dict[str, Any]:
     """Compute aggregate statistics over local SKILL.md files."""
     skills = list_skills(skills_dir)
     total = len(skills)
-    validated = sum(1 for s in skills if s.get("validation_passed"))
-    domains = sorted(
-        {s["domain"] for s in skills if isinstance(s.get("domain"), str) and s["domain"]}
-    )
-    categories = sorted(
-        {
-            s["category"]
-            for s in skills
-            if isinstance(s.get("category"), str) and s["category"]
-        }
-    )
+    validated = 0
+    domain_set: set[str] = set()
+    category_set: set[str] = set()
+    for s in skills:
+        if s.get("validation_passed"):
+            validated += 1
+        domain = s.get("domain")
+        if isinstance(domain, str) and domain:
+            domain_set.add(domain)
+        category = s.get("category")
+        if isinstance(category, str) and category:
+            category_set.add(category)
+    domains = sorted(domain_set)
+    categories = sorted(category_set)
     success_rate = (validated / total * 100.0) if total > 0 else 0.0
 
     return {
@@ -6,13 +6,13 @@ statistics, and sends them via the notifier.
 
 from __future__ import annotations
 
-import os
 from datetime import datetime, timezone
 from typing import Any, Dict
 
 from loguru import logger
 
-from .db import get_client, get_stats
+from .config import config
+from .db import get_daily_summary
 from .notifier import send_daily_summary
 
 
@@ -23,22 +23,9 @@ def _today_start_iso() -> str:
 
 def build_daily_summary_payload() -> Dict[str, Any]:
     """Build the payload expected by notifier.send_daily_summary."""
-    stats = get_stats()
-    total = stats.get("total", 0)
-
-    try:
-        client = get_client()
-        today_start = _today_start_iso()
-        resp = (
-            client.table("skills")
-            .select("name, description, domain, validation_passed, created_at")
-            .gte("created_at", today_start)
-            .execute()
-        )
-        rows = getattr(resp, "data", []) or []
-    except Exception:
-        logger.exception("Failed to fetch skills for daily summary.")
-        rows = []
+    summary = get_daily_summary(_today_start_iso())
+    total = summary["total"]
+    rows = summary["rows"]
 
     learned_rows = [r for r in rows if r.get("validation_passed")]
     failed_rows = [r for r in rows if not r.get("validation_passed")]
@@ -57,7 +44,7 @@ def build_daily_summary_payload() -> Dict[str, Any]:
     learned_list = "\n".join(f"- {_fmt_row(r)}" for r in learned_rows) or "None"
     failed_list = "\n".join(f"- {_fmt_row(r)}" for r in failed_rows) or "None"
 
-    dashboard_url = os.environ.get("DASHBOARD_URL", "")
+    dashboard_url = config().dashboard_url or ""
 
     payload: Dict[str, Any] = {
         "learned": len(learned_rows),
@@ -8,16 +8,25 @@ Strategy
 1. Ask the LLM to generate a minimal bash test script from the skill's
    ## Procedure section — skipping any steps that require external accounts,
    live servers, credentials, or network-dependent services.
-2. Run the generated script inside a short-lived Docker container.
+2. Run the generated script inside a warm, long-lived Docker container
+   (one per image, reused across validations) in a fresh working directory.
 3. Capture stdout/stderr and exit code, report pass/fail with details.
 """
 
 from __future__ import annotations
 
+import atexit
+import os
 import re
+import socket
 import subprocess
+import sys
 import textwrap
+import threading
+import uuid
 from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Dict, List, Set
 
 from loguru import logger
 
@@ -32,6 +41,8 @@ class ValidationResult:
     passed: bool
     attempts: int
     details: str
+    # False when retrying cannot help (e.g. Docker is unavailable).
+    retryable: bool = True
 
 
 _VALIDATOR_SYSTEM_PROMPT = textwrap.dedent("""\
@@ -90,30 +101,253 @@ def _generate_validation_script(skill_name: str, skill_markdown: str) -> str:
     return script.strip()
 
 
-def _run_in_docker(
-    script: str,
-    docker_image: str,
-    timeout_seconds: int,
-) -> tuple[bool, str]:
-    """Run a bash script inside a Docker container, return (passed, details)."""
-    command = [
-        "docker", "run", "--rm",
-        "--network", "host",          # allow pip installs
-        "--memory", "512m",
-        "--cpus", "1",
-        docker_image,
-        "bash", "-c", script,
-    ]
+# Host directory mounted as pip's cache so wheels survive container restarts.
+_PIP_CACHE_DIR = Path.home() / ".cache" / "skill-forge-pip"
+
+# Pooled containers carry the owning process's id under this label, and that
+# process holds an OS lock on `<owner>.lock` in _OWNER_DIR while it lives, so a
+# later run can tell containers orphaned by a crash from ones still in use.
+_POOL_LABEL = "skill-forge-sandbox"
+_HOST_LABEL = "skill-forge-sandbox.host"
+_OWNER_DIR = Path.home() / ".cache" / "skill-forge-sandbox"
+
+# `docker exec` errors meaning the pooled container itself is gone.
+_DEAD_CONTAINER_MARKERS = ("is not running", "No such container")
+
+
+def _try_lock(handle: IO[bytes]) -> bool:
+    """Take a non-blocking exclusive lock on an open file; False if held elsewhere."""
+    try:
+        if sys.platform == "win32":
+            import msvcrt
+
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+
+def _owner_alive(owner: str) -> bool:
+    """Return whether the pool process that labelled a container still runs."""
+    lock_path = _OWNER_DIR / f"{owner}.lock"
     try:
+        handle = open(lock_path, "r+b")
+    except FileNotFoundError:
+        return False
+    with handle:
+        if not _try_lock(handle):
+            return True
+    lock_path.unlink(missing_ok=True)
+    return False
+
+
+class _DockerPool:
+    """Warm sandbox containers, reused across validations.
+
+    Starting a container costs far more than exec-ing into a running one,
+    so each image gets long-lived ``sleep infinity`` containers that
+    validations borrow. Scripts run in a fresh temporary directory, but
+    that is the only isolation between them: packages they install and
+    files they write elsewhere remain for later validations, so a skill
+    can pass on state an earlier skill left behind.
+
+    Containers that time out or die are discarded, and all containers are
+    removed at exit. Exit hooks do not run on SIGTERM or a crash, so before
+    the first container is started, labelled containers whose owning
+    process has exited are removed; those of other live processes are kept.
+    """
+
+    def __init__(self) -> None:
+        self._idle: Dict[str, List[str]] = {}
+        self._all: Set[str] = set()
+        self._lock = threading.Lock()
+        self._owner = uuid.uuid4().hex
+        self._owner_handle: IO[bytes] | None = None
+        self._swept = False
+        self._sweep_done = threading.Event()
+
+    def _claim_owner(self) -> None:
+        """Create and lock this process's owner file for the life of the process."""
+        _OWNER_DIR.mkdir(parents=True, exist_ok=True)
+        lock_path = _OWNER_DIR / f"{self._owner}.lock"
+        for _ in range(3):
+            handle = open(lock_path, "w+b")
+            handle.write(b"\0")
+            handle.flush()
+            locked = _try_lock(handle)
+            # A concurrent sweep may have unlinked the file before we locked it.
+            if locked and lock_path.exists() and os.path.samestat(
+                os.fstat(handle.fileno()), os.stat(lock_path)
+            ):
+                self._owner_handle = handle
+                return
+            handle.close()
+        logger.warning("Could not lock sandbox owner file {}", lock_path)
+
+    def _remove_leftovers(self) -> None:
+        """Remove this host's pool containers whose owning process has exited."""
+        listed = subprocess.run(
+            [
+                "docker", "ps", "--all",
+                "--filter", f"label={_HOST_LABEL}={socket.gethostname()}",
+                "--format", f'{{{{.ID}}}} {{{{.Label "{_POOL_LABEL}"}}}}',
+            ],
+            capture_output=True,
+            text=True,
+            timeout=60,
+            check=False,
+        )
+        orphans = []
+        for line in listed.stdout.splitlines():
+            container_id, _, owner = line.partition(" ")
+            owner = owner.strip()
+            if not owner.isalnum():
+                continue  # not a pool owner id; leave it alone
+            if owner != self._owner and not _owner_alive(owner):
+                orphans.append(container_id)
+        if orphans:
+            subprocess.run(
+                ["docker", "rm", "--force", *orphans],
+                capture_output=True,
+                timeout=60,
+                check=False,
+            )
+            logger.info("Removed {} leftover sandbox container(s)", len(orphans))
+
+    def _sweep_once(self) -> None:
+        """Run the leftover sweep once; concurrent callers wait until it is done."""
+        with self._lock:
+            sweep = not self._swept
+            self._swept = True
+        if not sweep:
+            self._sweep_done.wait()
+            return
+        try:
+            self._claim_owner()
+            self._remove_leftovers()
+        except Exception:  # noqa: BLE001
+            logger.warning("Failed to remove leftover sandbox containers")
+        finally:
+            self._sweep_done.set()
+
+    def acquire(self, docker_image: str) -> str:
+        """Return an idle container for the image, starting one if needed."""
+        with self._lock:
+            idle = self._idle.get(docker_image)
+            if idle:
+                return idle.pop()
+
+        self._sweep_once()
+        _PIP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
         completed = subprocess.run(
-            command,
+            [
+                "docker", "run", "--detach", "--rm",
+                "--label", f"{_POOL_LABEL}={self._owner}",
+                "--label", f"{_HOST_LABEL}={socket.gethostname()}",
+                "--network", "host",          # allow pip installs
+                "--memory", "512m",
+                "--cpus", "1",
+                # --mount rather than -v: Windows host paths contain a colon.
+                "--mount", f"type=bind,source={_PIP_CACHE_DIR},target=/root/.cache/pip",
+                docker_image,
+                "sleep", "infinity",
+            ],
+            capture_output=True,
+            text=True,
+            timeout=300,                      # may include pulling the image
+            check=True,
+        )
+        container_id = completed.stdout.strip()
+        with self._lock:
+            self._all.add(container_id)
+        logger.info("Started sandbox container {} ({})", container_id[:12], docker_image)
+        return container_id
+
+    def release(self, docker_image: str, container_id: str) -> None:
+        """Return a healthy container to the pool."""
+        with self._lock:
+            if container_id in self._all:
+                self._idle.setdefault(docker_image, []).append(container_id)
+
+    def discard(self, container_id: str) -> None:
+        """Remove a container that timed out or is no longer usable."""
+        with self._lock:
+            self._all.discard(container_id)
+        subprocess.run(
+            ["docker", "rm", "--force", container_id],
             capture_output=True,
-            text=False,           # bytes mode — avoids Windows cp1252 decode errors
-            timeout=timeout_seconds,
+            timeout=60,
             check=False,
         )
+
+    def shutdown(self) -> None:
+        """Remove every container the pool started."""
+        with self._lock:
+            containers = list(self._all)
+            self._all.clear()
+            self._idle.clear()
+            handle, self._owner_handle = self._owner_handle, None
+        if handle is not None:
+            handle.close()
+            (_OWNER_DIR / f"{self._owner}.lock").unlink(missing_ok=True)
+        if not containers:
+            return
+        try:
+            subprocess.run(
+                ["docker", "rm", "--force", *containers],
+                capture_output=True,
+                timeout=60,
+                check=False,
+            )
+        except Exception:  # noqa: BLE001
+            logger.warning("Failed to remove sandbox containers: {}", containers)
+
+
+_POOL = _DockerPool()
+atexit.register(_POOL.shutdown)
+
+
+def _exec_in_container(container_id: str, script: str, timeout_seconds: int) -> subprocess.CompletedProcess:
+    """Run a bash script in a fresh temp directory inside a pooled container."""
+    wrapped = 'cd "$(mktemp -d)" || exit 1\n' + script
+    return subprocess.run(
+        ["docker", "exec", container_id, "bash", "-c", wrapped],
+        capture_output=True,
+        text=False,           # bytes mode — avoids Windows cp1252 decode errors
+        timeout=timeout_seconds,
+        check=False,
+    )
+
+
+def _run_in_docker(
+    script: str,
+    docker_image: str,
+    timeout_seconds: int,
+) -> tuple[bool, str, bool]:
+    """Run a bash script inside a pooled Docker container.
+
+    Returns (passed, details, retryable); ``retryable`` is False when the
+    sandbox itself is unavailable, so another attempt would fail the same way.
+    """
+    container_id = ""
+    try:
+        # Retry once on a fresh container if the pooled one has died.
+        for _ in range(2):
+            container_id = _POOL.acquire(docker_image)
+            completed = _exec_in_container(container_id, script, timeout_seconds)
+            stderr = completed.stderr.decode("utf-8", errors="replace").strip()
+            if completed.returncode != 0 and any(m in stderr for m in _DEAD_CONTAINER_MARKERS):
+                _POOL.discard(container_id)
+                container_id = ""
+                continue
+            break
+        _POOL.release(docker_image, container_id)
+
         stdout = completed.stdout.decode("utf-8", errors="replace").strip()
-        stderr = completed.stderr.decode("utf-8", errors="replace").strip()
         passed = completed.returncode == 0
 
         parts = [f"exit_code={completed.returncode}"]
@@ -122,14 +356,20 @@ def _run_in_docker(
         if stderr and not passed:
             parts.append(f"stderr:\n{stderr[-800:]}")  # trim long errors
 
-        return passed, "\n".join(parts)
+        return passed, "\n".join(parts), True
 
     except subprocess.TimeoutExpired:
-        return False, f"Timed out after {timeout_seconds}s"
+        # The script may still be running inside the container; don't reuse it.
+        if container_id:
+            _POOL.discard(container_id)
+        return False, f"Timed out after {timeout_seconds}s", True
     except FileNotFoundError:
-        return False, "Docker executable not found. Ensure Docker is installed and on PATH."
+        return False, "Docker executable not found. Ensure Docker is installed and on PATH.", False
+    except subprocess.CalledProcessError as exc:
+        stderr = (exc.stderr or "").strip()
+        return False, f"Failed to start sandbox container: {stderr[-800:] or exc!r}", False
     except Exception as exc:  # noqa: BLE001
-        return False, f"Unexpected error: {exc!r}"
+        return False, f"Unexpected error: {exc!r}", True
 
 
 def validate_skill(
@@ -163,7 +403,7 @@ def validate_skill(
             details=details,
         )
 
-    passed, details = _run_in_docker(script, docker_image, timeout_seconds)
+    passed, details, retryable = _run_in_docker(script, docker_image, timeout_seconds)
 
     logger.info(
         "Validation for skill '%s' finished: passed=%s", skill_name, passed
@@ -174,4 +414,5 @@ def validate_skill(
         passed=passed,
         attempts=attempts,
         details=details,
+        retryable=retryable,
     )
@@ -25,6 +25,17 @@ class SkillDraft:
     content: str
     metadata: Dict[str, Any]
 
+    @property
+    def description(self) -> str:
+        """Frontmatter ``description``, or ``""``."""
+        return self.metadata.get("description", "")
+
+    @property
+    def category(self) -> str:
+        """Frontmatter ``metadata.hermes.category``, or ``"uncategorized"``."""
+        hermes = (self.metadata.get("metadata") or {}).get("hermes") or {}
+        return hermes.get("category", "uncategorized")
+
 
 def _load_writer_system_prompt() -> str:
     """Load the writer system prompt from prompts/writer_prompt.txt."""
@@ -66,14 +77,18 @@ def write_skill(research: ResearchBundle, model: str | None = None) -> SkillDraf
     metadata: Dict[str, Any] = {}
     # Best-effort extraction of basic fields from YAML frontmatter if present.
     try:
-        from yaml import safe_load  # imported lazily to avoid hard dependency at import time
+        # imported lazily to avoid hard dependency at import time
+        # (and the skill_manager -> writer import cycle)
+        from yaml import load as yaml_load
+
+        from .skill_manager import _SafeLoader
 
         lines = content.splitlines()
         if lines and lines[0].strip() == "---":
             for idx in range(1, len(lines)):
                 if lines[idx].strip() == "---":
                     frontmatter = "\n".join(lines[1:idx])
-                    metadata = safe_load(frontmatter) or {}
+                    metadata = yaml_load(frontmatter, Loader=_SafeLoader) or {}
                     break
     except Exception:
         logger.exception("Failed to parse YAML frontmatter from SKILL.md draft.")
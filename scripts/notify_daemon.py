@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Forward Skill Forge notifications received on a Unix datagram socket.
+
+Binds `SKILL_FORGE_NOTIFIER_SOCK` and sends each event that `forge.notifier.notify`
+hands over to Telegram, using the notifier's batching. Run it alongside the
+agent so pipeline steps never wait on Telegram:
+
+    SKILL_FORGE_NOTIFIER_SOCK=/tmp/skill-forge-notify.sock python scripts/notify_daemon.py
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from loguru import logger
+
+from forge.config import config
+from forge.notifier import build_message, dispatch, flush_notifications
+
+_MAX_DATAGRAM = 65536
+
+
+def main() -> int:
+    sock_path = config().skill_forge_notifier_sock
+    if not sock_path:
+        print("SKILL_FORGE_NOTIFIER_SOCK is not set.")
+        return 1
+    if not hasattr(socket, "AF_UNIX"):
+        print("Unix domain sockets are not supported on this platform.")
+        return 1
+
+    # Remove a socket file left behind by a previous run.
+    if os.path.exists(sock_path):
+        os.unlink(sock_path)
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    sock.bind(sock_path)
+    print(f"Forwarding notifications from {sock_path} (Ctrl+C to stop)")
+    try:
+        while True:
+            data = sock.recv(_MAX_DATAGRAM)
+            try:
+                item = json.loads(data)
+                message = build_message(str(item["event"]), **dict(item.get("kwargs") or {}))
+            except Exception:
+                logger.exception("Dropping malformed notification datagram.")
+                continue
+            dispatch(message)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sock.close()
+        os.unlink(sock_path)
+        flush_notifications()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
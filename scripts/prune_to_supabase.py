@@ -15,26 +15,11 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from dotenv import load_dotenv
-from yaml import safe_load
 
 load_dotenv()
 
 from forge import db
-
-
-def _name_from_content(content: str) -> str | None:
-    """Extract frontmatter `name` from SKILL.md content."""
-    lines = content.strip().splitlines()
-    if not lines or lines[0].strip() != "---":
-        return None
-    for i in range(1, len(lines)):
-        if lines[i].strip() == "---":
-            try:
-                fm = safe_load("\n".join(lines[1:i])) or {}
-                return fm.get("name") if isinstance(fm.get("name"), str) else None
-            except Exception:
-                return None
-    return None
+from forge.skill_manager import _iter_skill_md
 
 
 def main() -> int:
@@ -43,9 +28,13 @@ def main() -> int:
 
     print("Querying Supabase for canonical skill names...")
     client = db.get_client()
+    # Only the name columns: `frontmatter_name` is generated from the SKILL.md
+    # frontmatter in Postgres (see supabase/migrations), so bodies stay server-side.
     resp = (
         client.table("skills")
-        .select("id, name, content, created_at")
+        .select("id, name, frontmatter_name, created_at")
+        .not_.is_("content", "null")
+        .neq("content", "")
         .order("created_at", desc=True)
         .execute()
     )
@@ -54,17 +43,14 @@ def main() -> int:
     # Build canonical set: skill names that exist in Supabase (dedupe by frontmatter name)
     canonical_names: set[str] = set()
     for row in supabase_rows:
-        content = row.get("content")
-        if not content:
-            continue
-        name = _name_from_content(content) or row.get("name")
+        name = row.get("frontmatter_name") or row.get("name")
         if name and name.strip():
             canonical_names.add(name.strip())
 
     print(f"Canonical skills in Supabase: {len(canonical_names)}")
 
     # Find local skill dirs
-    local_dirs = [p.parent for p in root.rglob("SKILL.md") if "/.git/" not in str(p) and "\\.git\\" not in str(p)]
+    local_dirs = [Path(p).parent for p in _iter_skill_md(root)]
     to_remove = [d for d in local_dirs if d.name not in canonical_names]
 
     if not to_remove:
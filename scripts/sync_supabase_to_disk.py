@@ -9,74 +9,53 @@ frontmatter for the directory (agentskills.io spec).
 from __future__ import annotations
 
 import os
-import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from dotenv import load_dotenv
-from yaml import safe_load
 
 load_dotenv()
 
 from forge import db
-from forge.skill_manager import _unwrap_code_fence, _sanitize_frontmatter
+from forge.skill_manager import (
+    _frontmatter_text,
+    _iter_skill_md,
+    _load_frontmatter,
+    _sanitize_frontmatter,
+    _set_frontmatter_name,
+    _unwrap_code_fence,
+)
+
+_WRITE_WORKERS = 16
+_PAGE_SIZE = 500
 
 
 def _name_from_content(content: str) -> str | None:
     """Extract frontmatter `name` from SKILL.md content."""
-    lines = content.strip().splitlines()
-    if not lines or lines[0].strip() != "---":
+    frontmatter = _frontmatter_text(content.lstrip())
+    if frontmatter is None:
+        return None
+    try:
+        fm = _load_frontmatter(frontmatter) or {}
+        return fm.get("name") if isinstance(fm.get("name"), str) else None
+    except Exception:
         return None
-    for i in range(1, len(lines)):
-        if lines[i].strip() == "---":
-            try:
-                fm = safe_load("\n".join(lines[1:i])) or {}
-                return fm.get("name") if isinstance(fm.get("name"), str) else None
-            except Exception:
-                return None
-    return None
-
-
-def _set_frontmatter_name(content: str, target_name: str) -> str:
-    """Ensure frontmatter `name` matches target_name (agentskills.io spec)."""
-    lines = content.strip().splitlines()
-    if not lines or lines[0].strip() != "---":
-        return content
-    for i in range(1, len(lines)):
-        if lines[i].strip() == "---":
-            # Replace name: ... with name: target_name
-            new_fm_lines = []
-            for j in range(1, i):
-                line = lines[j]
-                if re.match(r"^\s*name\s*:", line):
-                    indent = line[: len(line) - len(line.lstrip())]
-                    new_fm_lines.append(f"{indent}name: {target_name}")
-                else:
-                    new_fm_lines.append(line)
-            return "\n".join(lines[:1] + new_fm_lines + lines[i:])
-    return content
-
-
-def main() -> int:
-    skills_dir = os.environ.get("SKILLS_DIR") or os.path.expanduser("~/.hermes/skills")
-    root = Path(skills_dir).expanduser()
 
-    print("Querying Supabase for all skills...")
-    client = db.get_client()
-    resp = client.table("skills").select("id, name, content, created_at").order("created_at", desc=True).execute()
-    supabase_rows = resp.data or []
-    print(f"Found {len(supabase_rows)} skills in Supabase")
 
-    # Get local skill names (directory names)
-    local_names = {p.parent.name for p in root.rglob("SKILL.md")}
-    print(f"Found {len(local_names)} skills on disk")
+def _process_page(
+    rows: list[dict],
+    by_name: dict[str, tuple[str, str]],
+    local_names: set[str],
+) -> None:
+    """Fold one page of Supabase rows into `by_name`, keeping the latest per name.
 
-    # Build map: skill_name -> (content, created_at). Prefer latest by created_at.
-    by_name: dict[str, tuple[str, str]] = {}
-    for row in supabase_rows:
+    Skills already on disk are skipped so their content is not retained.
+    """
+    for row in rows:
         content = row.get("content")
         if not content:
             continue
@@ -84,11 +63,58 @@ def main() -> int:
         if not name or not name.strip():
             continue
         name = name.strip()
+        if name in local_names:
+            continue
         created = row.get("created_at", "")
         if name not in by_name or (created and by_name[name][1] < created):
             by_name[name] = (content, created)
 
-    missing = [(n, c) for n, (c, _) in by_name.items() if n not in local_names]
+
+def _write_one(root: Path, name: str, content: str) -> Path:
+    """Normalize one skill's content and write it to `root/<name>/SKILL.md`."""
+    skill_dir = root / name
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    content = _unwrap_code_fence(content)
+    content = _sanitize_frontmatter(content)
+    content = _set_frontmatter_name(content.strip(), name)  # Ensure name matches directory
+    skill_path = skill_dir / "SKILL.md"
+    skill_path.write_text(content, encoding="utf-8")
+    return skill_path
+
+
+def main() -> int:
+    skills_dir = os.environ.get("SKILLS_DIR") or os.path.expanduser("~/.hermes/skills")
+    root = Path(skills_dir).expanduser()
+
+    # Get local skill names (directory names)
+    local_names = {os.path.basename(os.path.dirname(p)) for p in _iter_skill_md(root)}
+    print(f"Found {len(local_names)} skills on disk")
+
+    print("Querying Supabase for all skills...")
+    client = db.get_client()
+    # Build map: skill_name -> (content, created_at). Prefer latest by created_at.
+    # Rows are fetched a page at a time so only one page of bodies is resident.
+    by_name: dict[str, tuple[str, str]] = {}
+    row_count = 0
+    offset = 0
+    while True:
+        resp = (
+            client.table("skills")
+            .select("id, name, content, created_at")
+            .order("created_at", desc=True)
+            .order("id")
+            .range(offset, offset + _PAGE_SIZE - 1)
+            .execute()
+        )
+        rows = resp.data or []
+        _process_page(rows, by_name, local_names)
+        row_count += len(rows)
+        if len(rows) < _PAGE_SIZE:
+            break
+        offset += _PAGE_SIZE
+    print(f"Found {row_count} skills in Supabase")
+
+    missing = [(n, c) for n, (c, _) in by_name.items()]
     print(f"Missing on disk: {len(missing)} skills")
     if missing:
         print("Missing skill names:", sorted(n for n, _ in missing))
@@ -97,15 +123,11 @@ def main() -> int:
         print("All Supabase skills are already on disk.")
         return 0
 
-    for name, content in missing:
-        skill_dir = root / name
-        skill_dir.mkdir(parents=True, exist_ok=True)
-        content = _unwrap_code_fence(content)
-        content = _sanitize_frontmatter(content)
-        content = _set_frontmatter_name(content, name)  # Ensure name matches directory
-        skill_path = skill_dir / "SKILL.md"
-        skill_path.write_text(content, encoding="utf-8")
-        print(f"  Written: {skill_path}")
+    # Each write is a handful of small syscalls; run them concurrently.
+    with ThreadPoolExecutor(max_workers=min(_WRITE_WORKERS, len(missing))) as pool:
+        written = pool.map(lambda item: _write_one(root, *item), missing)
+        for skill_path in written:
+            print(f"  Written: {skill_path}")
 
     print(f"\nWrote {len(missing)} missing skills to {root}")
     return 0
@@ -7,158 +7,199 @@ reporting status, and producing summaries.
 from __future__ import annotations
 
 import argparse
-import os
+import hashlib
+import json
 import sys
 import time
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
 
-import schedule
 from dotenv import load_dotenv
 from loguru import logger
 from rich.console import Console
-from rich.table import Table
 
 from forge import db
-from forge.notifier import notify
-from forge.publisher import publish_skill
-from forge.researcher import research_domain
-from forge.skill_manager import save_skill
-from forge.summarizer import run_daily_summary
-from forge.validator import validate_skill
-from forge.writer import write_skill
+from forge.config import config
+
+# Pipeline modules (and `schedule`/`rich.table`) are imported inside the
+# commands that use them, so `--help`, `status` and `to-prompt` start fast.
 
 
 console = Console()
 
 
 def _configure_logging() -> None:
-    """Configure basic loguru logging."""
+    """Configure basic loguru logging.
+
+    Exception traces skip loguru's variable-annotating ``diagnose`` and
+    extended ``backtrace`` modes, which inspect every frame.
+    """
     load_dotenv()
     logger.remove()
-    logger.add(sys.stderr, level="INFO")
+    logger.add(sys.stderr, level="INFO", backtrace=False, diagnose=False)
 
 
 def _learn_domain(domain: str) -> None:
     """Run the full learn pipeline for a single domain."""
-    console.print(
-        f"[bold green]Skill Forge[/bold green] learning domain: [cyan]{domain}[/cyan]"
-    )
+    from forge.notifier import notify
+    from forge.publisher import publish_skill
+    from forge.researcher import research_domain
+    from forge.skill_manager import save_skill
+    from forge.validator import validate_skill
+    from forge.writer import write_skill
+
+    # Rich markup is only worth parsing when it will be rendered (not in CI logs).
+    if console.is_terminal:
+        console.print(
+            f"[bold green]Skill Forge[/bold green] learning domain: [cyan]{domain}[/cyan]"
+        )
+    else:
+        console.out(f"Skill Forge learning domain: {domain}", highlight=False)
     logger.info("Starting learn pipeline for domain: {domain}", domain=domain)
 
-    # Research
-    db.insert_event("research_start", domain=domain, message="Starting research")
-    notify("research_start", domain=domain)
-    research = research_domain(domain)
-    db.insert_event(
-        "research_done",
-        domain=domain,
-        message=f"Collected {len(research.sources)} sources",
-        metadata={"sources": research.sources, "sources_count": len(research.sources)},
-    )
-    notify("research_done", domain=domain, source_count=len(research.sources))
-
-    # Write SKILL.md
-    db.insert_event("writing", domain=domain, message="Writing SKILL.md")
-    notify("writing", skill_name=domain)
-    draft = write_skill(research)
-
-    # Validate
-    attempts = 0
-    max_attempts = 3
-    validation_passed = False
-    last_details = ""
-
-    while attempts < max_attempts and not validation_passed:
-        attempts += 1
-        db.insert_event(
-            "validating",
+    # Progress events are buffered and written in bulk (see db.event_row).
+    events: List[Dict[str, Any]] = []
+
+    def record_event(event_type: str, **fields: Any) -> None:
+        events.append(db.event_row(event_type, **fields))
+
+    try:
+        # Research
+        record_event("research_start", domain=domain, message="Starting research")
+        notify("research_start", domain=domain)
+        research = research_domain(domain)
+        sources = research.sources
+        source_count = len(sources)
+        if not research.cached:
+            # Cache hits were recorded when first researched.
+            db.insert_sources_bulk(domain, sources)
+        record_event(
+            "research_done",
             domain=domain,
-            skill_name=draft.name,
-            message=f"Validation attempt {attempts}",
+            message=f"Collected {source_count} sources",
+            metadata={"sources_count": source_count},
         )
-        notify("validating", skill_name=draft.name)
-        result = validate_skill(draft.name, draft.content)
-        validation_passed = result.passed
-        last_details = result.details
-
-        if result.passed:
-            db.insert_event(
-                "validated_ok",
+        notify("research_done", domain=domain, source_count=source_count)
+
+        # Write SKILL.md
+        record_event("writing", domain=domain, message="Writing SKILL.md")
+        notify("writing", skill_name=domain)
+        draft = write_skill(research)
+
+        # Validate
+        attempts = 0
+        max_attempts = 3
+        validation_passed = False
+        last_details = ""
+
+        while attempts < max_attempts and not validation_passed:
+            attempts += 1
+            record_event(
+                "validating",
                 domain=domain,
                 skill_name=draft.name,
-                message="Validation succeeded",
-                metadata={"attempts": attempts, "details": result.details},
-            )
-            notify(
-                "validated_ok",
-                skill_name=draft.name,
-                description=draft.metadata.get("description", ""),
-                steps_tested=attempts,
+                message=f"Validation attempt {attempts}",
             )
-        else:
-            db.insert_event(
-                "validated_fail",
+            notify("validating", skill_name=draft.name)
+            result = validate_skill(draft.name, draft.content)
+            validation_passed = result.passed
+            last_details = result.details
+
+            if result.passed:
+                record_event(
+                    "validated_ok",
+                    domain=domain,
+                    skill_name=draft.name,
+                    message="Validation succeeded",
+                    metadata={"attempts": attempts, "details": result.details},
+                )
+                notify(
+                    "validated_ok",
+                    skill_name=draft.name,
+                    description=draft.description,
+                    steps_tested=attempts,
+                )
+            else:
+                record_event(
+                    "validated_fail",
+                    domain=domain,
+                    skill_name=draft.name,
+                    message="Validation failed",
+                    metadata={"attempts": attempts, "details": result.details},
+                )
+                notify("validated_fail", skill_name=draft.name, attempt=attempts)
+                if not result.retryable:
+                    # Each attempt regenerates the test script, but a missing
+                    # sandbox fails identically every time.
+                    break
+
+        # Save skill regardless of validation outcome; the dashboard shows status.
+        try:
+            skill_path = save_skill(draft)
+        except Exception:
+            logger.exception("Failed to save SKILL.md for domain: {domain}", domain=domain)
+            record_event(
+                "error",
                 domain=domain,
                 skill_name=draft.name,
-                message="Validation failed",
-                metadata={"attempts": attempts, "details": result.details},
+                message="Failed to save SKILL.md",
             )
-            notify("validated_fail", skill_name=draft.name, attempt=attempts)
-
-    # Save skill regardless of validation outcome; the dashboard shows status.
-    try:
-        skill_path = save_skill(draft)
-    except Exception:
-        logger.exception("Failed to save SKILL.md for domain: {domain}", domain=domain)
-        db.insert_event(
-            "error",
-            domain=domain,
-            skill_name=draft.name,
-            message="Failed to save SKILL.md",
+            raise
+
+        # Publish to GitHub skills repo (if GITHUB_TOKEN + GITHUB_SKILLS_REPO are set).
+        # This is the only blocking network call after validation: Supabase
+        # writes and notifications are dispatched in the background, and
+        # publishing waits for save_skill() to accept the draft.
+        github_url = publish_skill(draft.name, draft.content)
+        skill_public_url = github_url or (config().dashboard_url or "")
+
+        # The buffered progress events go out in the same background task,
+        # ahead of the skill row and its "saved" event, so the feed stays in order.
+        pending = list(events)
+        events.clear()
+        db.save_skill_and_event(
+            skill={
+                "name": draft.name,
+                "domain": domain,
+                "category": draft.category,
+                "description": draft.description,
+                "content": draft.content,
+                "validation_passed": validation_passed,
+                "sources_count": source_count,
+                "attempts": attempts,
+            },
+            event={
+                "event_type": "saved",
+                "domain": domain,
+                "skill_name": draft.name,
+                "message": f"Saved SKILL.md at {skill_path}",
+                "metadata": {"github_url": github_url or ""},
+            },
+            events=pending,
         )
-        raise
-
-    # Persist to Supabase skills table.
-    category = (
-        draft.metadata.get("metadata", {})
-        .get("hermes", {})
-        .get("category", "uncategorized")
-    )
-    description = draft.metadata.get("description", "")
-    db.insert_skill(
-        name=draft.name,
-        domain=domain,
-        category=category,
-        description=description,
-        content=draft.content,
-        validation_passed=validation_passed,
-        sources_count=len(research.sources),
-        attempts=attempts,
-    )
-
-    # Publish to GitHub skills repo (if GITHUB_TOKEN + GITHUB_SKILLS_REPO are set).
-    github_url = publish_skill(draft.name, draft.content)
-    skill_public_url = github_url or os.environ.get("DASHBOARD_URL", "")
-
-    db.insert_event(
-        "saved",
-        domain=domain,
-        skill_name=draft.name,
-        message=f"Saved SKILL.md at {skill_path}",
-        metadata={"github_url": github_url or ""},
-    )
-    notify("saved", skill_name=draft.name, dashboard_url=skill_public_url)
+        notify("saved", skill_name=draft.name, dashboard_url=skill_public_url)
+    finally:
+        # Flush whatever was not handed to save_skill_and_event(), e.g. on failure.
+        db.insert_events_bulk(events)
 
-    console.print(
-        f"[bold green]Done[/bold green] learning [cyan]{domain}[/cyan] "
-        f"(validated={validation_passed}, attempts={attempts})."
-    )
+    if console.is_terminal:
+        console.print(
+            f"[bold green]Done[/bold green] learning [cyan]{domain}[/cyan] "
+            f"(validated={validation_passed}, attempts={attempts})."
+        )
+    else:
+        console.out(
+            f"Done learning {domain} (validated={validation_passed}, attempts={attempts}).",
+            highlight=False,
+        )
     logger.info(
-        "Finished learn pipeline for domain: {domain} (validated=%s, attempts=%s, details=%s)",
-        validation_passed,
-        attempts,
-        last_details,
+        "Finished learn pipeline for domain: {domain} (validated={passed}, attempts={attempts}, details={details})",
         domain=domain,
+        passed=validation_passed,
+        attempts=attempts,
+        details=last_details,
     )
 
 
@@ -176,24 +217,60 @@ def cmd_learn(args: argparse.Namespace) -> int:
         return 1
 
 
+# (mtime_ns, domains) for the last parse of config/forge_config.yaml.
+_DOMAINS_CACHE: Tuple[int, List[str]] | None = None
+
+
 def _load_domains_from_config() -> List[str]:
-    """Load default domains for learn-all from config/forge_config.yaml if present."""
-    from pathlib import Path
+    """Load default domains for learn-all from config/forge_config.yaml if present.
 
-    import yaml
+    The parsed list is reused until the file's mtime changes.
+    """
+    global _DOMAINS_CACHE
 
     config_path = Path("config") / "forge_config.yaml"
-    if not config_path.exists():
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except OSError:
         return []
+    if _DOMAINS_CACHE is not None and _DOMAINS_CACHE[0] == mtime_ns:
+        return list(_DOMAINS_CACHE[1])
+
+    import yaml
+
+    from forge.skill_manager import _SafeLoader
 
     try:
-        data = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
+        data = yaml.load(config_path.read_text(encoding="utf-8"), Loader=_SafeLoader) or {}
     except Exception:
         logger.exception("Failed to read forge_config.yaml for learn-all.")
         return []
 
     domains = data.get("domains") or []
-    return [str(d) for d in domains if isinstance(d, str) and d.strip()]
+    result = [str(d) for d in domains if isinstance(d, str) and d.strip()]
+    _DOMAINS_CACHE = (mtime_ns, result)
+    return list(result)
+
+
+_DEFAULT_CONCURRENCY = 4
+
+
+def _learn_all_concurrency() -> int:
+    """Return the learn-all worker count from SKILL_FORGE_CONCURRENCY (default 4)."""
+    raw = config().skill_forge_concurrency
+    try:
+        return max(1, int(raw)) if raw else _DEFAULT_CONCURRENCY
+    except ValueError:
+        logger.warning("Invalid SKILL_FORGE_CONCURRENCY={raw!r}; using {n}.", raw=raw, n=_DEFAULT_CONCURRENCY)
+        return _DEFAULT_CONCURRENCY
+
+
+def _safe_learn(domain: str) -> None:
+    """Run `_learn_domain`, logging failures so other domains keep going."""
+    try:
+        _learn_domain(domain)
+    except Exception:
+        logger.exception("learn-all: failed for domain: {domain}", domain=domain)
 
 
 def cmd_learn_all(_args: argparse.Namespace) -> int:
@@ -209,12 +286,9 @@ def cmd_learn_all(_args: argparse.Namespace) -> int:
         "[bold]Running learn pipeline for configured domains:[/bold] "
         + ", ".join(f"[cyan]{d}[/cyan]" for d in domains)
     )
-    for domain in domains:
-        try:
-            _learn_domain(domain)
-        except Exception:
-            logger.exception("learn-all: failed for domain: {domain}", domain=domain)
-            continue
+    # Each domain is network-bound, so run a few pipelines side by side.
+    with ThreadPoolExecutor(max_workers=_learn_all_concurrency()) as pool:
+        list(pool.map(_safe_learn, domains))
     return 0
 
 
@@ -230,6 +304,14 @@ def cmd_status(_args: argparse.Namespace) -> int:
         )
         return 1
 
+    sys.stdout.write(_rendered_status(stats))
+    return 0
+
+
+def _render_status_table(stats: Dict[str, Any]) -> str:
+    """Render the status table to a string with the console's settings."""
+    from rich.table import Table
+
     table = Table(title="Skill Forge Status", show_header=True, header_style="bold magenta")
     table.add_column("Metric")
     table.add_column("Value")
@@ -242,21 +324,63 @@ def cmd_status(_args: argparse.Namespace) -> int:
     )
     table.add_row("Domains Covered", str(len(stats.get("domains", []))))
 
-    console.print(table)
-    return 0
+    with console.capture() as capture:
+        console.print(table)
+    return capture.get()
+
+
+_STATUS_CACHE_DIR = Path.home() / ".cache" / "skill_forge"
+
+
+def _rendered_status(stats: Dict[str, Any]) -> str:
+    """Return the rendered status table, reusing the on-disk render when unchanged.
+
+    Renders are keyed by the stats and the console's width and color system;
+    only the latest render is kept.
+    """
+    key_source = json.dumps(
+        {"stats": stats, "width": console.width, "color": console.color_system},
+        sort_keys=True,
+        default=str,
+    )
+    key = hashlib.blake2b(key_source.encode("utf-8"), digest_size=16).hexdigest()
+    cache_path = _STATUS_CACHE_DIR / f"status-{key}.ansi"
+    try:
+        return cache_path.read_text(encoding="utf-8")
+    except OSError:
+        pass
+
+    rendered = _render_status_table(stats)
+    try:
+        _STATUS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for stale in _STATUS_CACHE_DIR.glob("status-*.ansi"):
+            stale.unlink(missing_ok=True)
+        cache_path.write_text(rendered, encoding="utf-8")
+    except OSError:
+        logger.debug("Could not write status render cache at {path}", path=cache_path)
+    return rendered
 
 
 def cmd_summary(args: argparse.Namespace) -> int:
     """Handle the `summary` command."""
+    from forge.summarizer import run_daily_summary
+
     if args.daemon:
+        import schedule
+
         console.print(
             "[bold]Starting daily summary daemon.[/bold] "
             "Press Ctrl+C to stop."
         )
         schedule.every().day.at("09:00").do(run_daily_summary)
+        # Sleep until the next job is due instead of polling every second.
         while True:
+            idle = schedule.idle_seconds()
+            if idle is None:
+                break
+            if idle > 0:
+                time.sleep(idle)
             schedule.run_pending()
-            time.sleep(1)
     else:
         console.print("[bold]Running daily summary once…[/bold]")
         run_daily_summary()
@@ -265,7 +389,7 @@ def cmd_summary(args: argparse.Namespace) -> int:
 
 def cmd_to_prompt(args: argparse.Namespace) -> int:
     """Handle the `to-prompt` command — generate <available_skills> XML."""
-    from forge.skill_manager import _skills_root
+    from forge.skill_manager import _iter_skill_dirs, _skills_root
     try:
         import skills_ref
     except ImportError:
@@ -273,7 +397,7 @@ def cmd_to_prompt(args: argparse.Namespace) -> int:
         return 1
 
     root = _skills_root()
-    skill_dirs = [p.parent for p in root.rglob("SKILL.md")]
+    skill_dirs = list(_iter_skill_dirs(root, skip_hidden=True))
 
     if not skill_dirs:
         console.print("[yellow]No skills found in skills directory.[/yellow]")
@@ -282,8 +406,8 @@ def cmd_to_prompt(args: argparse.Namespace) -> int:
     xml = skills_ref.to_prompt(skill_dirs)
 
     if args.output:
-        from pathlib import Path
-        Path(args.output).write_text(xml, encoding="utf-8")
+        with open(args.output, "w", encoding="utf-8", newline="\n", buffering=1 << 20) as f:
+            f.write(xml)
         console.print(f"[green]Wrote <available_skills> XML to {args.output}[/green]")
     else:
         console.print(xml)
@@ -349,10 +473,16 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+@lru_cache(maxsize=1)
+def _parser() -> argparse.ArgumentParser:
+    """Return the argument parser, built once per process."""
+    return build_parser()
+
+
 def main(argv: list[str] | None = None) -> int:
     """Main entry point for the Skill Forge CLI."""
     _configure_logging()
-    parser = build_parser()
+    parser = _parser()
     args = parser.parse_args(argv)
     func = getattr(args, "func", None)
     if func is None:
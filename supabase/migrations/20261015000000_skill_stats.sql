@@ -0,0 +1,20 @@
+-- Aggregate statistics for `skill_forge.py status` and the daily summary.
+-- Computed server-side so forge.db.get_stats() needs a single round-trip.
+create or replace function skill_stats()
+returns json
+language sql
+stable
+as $$
+  select json_build_object(
+    'total', count(*),
+    'today_count', count(*) filter (
+      where created_at >= date_trunc('day', now() at time zone 'utc') at time zone 'utc'
+    ),
+    'success_count', count(*) filter (where validation_passed),
+    'domains', coalesce(
+      array_agg(distinct domain order by domain) filter (where domain is not null and domain <> ''),
+      '{}'
+    )
+  )
+  from skills;
+$$;
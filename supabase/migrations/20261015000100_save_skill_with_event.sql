@@ -0,0 +1,32 @@
+-- Insert a learned skill and its `saved` event in one transaction, so
+-- forge.db.save_skill_and_event() needs a single round-trip.
+create or replace function save_skill_with_event(p_skill jsonb, p_event jsonb)
+returns void
+language plpgsql
+as $$
+begin
+  insert into skills (
+    name, domain, category, description, content,
+    validation_passed, sources_count, attempts
+  )
+  values (
+    p_skill->>'name',
+    p_skill->>'domain',
+    p_skill->>'category',
+    p_skill->>'description',
+    p_skill->>'content',
+    coalesce((p_skill->>'validation_passed')::boolean, false),
+    coalesce((p_skill->>'sources_count')::integer, 0),
+    coalesce((p_skill->>'attempts')::integer, 1)
+  );
+
+  insert into events (event_type, domain, skill_name, message, metadata)
+  values (
+    p_event->>'event_type',
+    p_event->>'domain',
+    p_event->>'skill_name',
+    coalesce(p_event->>'message', ''),
+    coalesce(p_event->'metadata', '{}'::jsonb)
+  );
+end;
+$$;
@@ -0,0 +1,15 @@
+-- Top-level `name:` from each skill's SKILL.md frontmatter, maintained by
+-- Postgres so scripts/prune_to_supabase.py can read canonical names
+-- without downloading every SKILL.md body. Surrounding quotes and
+-- whitespace are trimmed; null when the frontmatter has no name line.
+alter table skills
+  add column if not exists frontmatter_name text
+  generated always as (
+    nullif(
+      btrim(
+        substring(content from '^\s*---[^\n]*\n(?:(?!---|name:)[^\n]*\n)*name:[ \t]*([^\n]*)'),
+        E' \t\r"'''
+      ),
+      ''
+    )
+  ) stored;
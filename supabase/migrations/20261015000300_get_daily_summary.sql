@@ -0,0 +1,29 @@
+-- Data for the daily summary notification in one round-trip: the total skill
+-- count plus every skill created since `since`. Used by
+-- forge.db.get_daily_summary().
+create or replace function get_daily_summary(since timestamptz)
+returns json
+language sql
+stable
+as $$
+  select json_build_object(
+    'total', (select count(*) from skills),
+    'todays_rows', coalesce(
+      (
+        select json_agg(
+          json_build_object(
+            'name', name,
+            'description', description,
+            'domain', domain,
+            'validation_passed', validation_passed,
+            'created_at', created_at
+          )
+          order by created_at
+        )
+        from skills
+        where created_at >= since
+      ),
+      '[]'::json
+    )
+  );
+$$;
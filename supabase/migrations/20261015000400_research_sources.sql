@@ -0,0 +1,12 @@
+-- Source URLs collected by each research run, one row per URL. Written in
+-- bulk by forge.db.insert_sources_bulk(); the `research_done` event only
+-- carries `sources_count`.
+create table if not exists research_sources (
+  id uuid default gen_random_uuid() primary key,
+  domain text not null,
+  url text not null,
+  created_at timestamptz default now()
+);
+
+create index if not exists research_sources_domain_created_at_idx
+  on research_sources (domain, created_at desc);
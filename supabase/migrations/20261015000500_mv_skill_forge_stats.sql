@@ -0,0 +1,62 @@
+-- Precomputed totals for `skill_forge.py status`, so skill_stats() does not
+-- scan the whole skills table on every call. The view is refreshed every
+-- five minutes by pg_cron, so skill_stats() only switches to it when that job
+-- can be scheduled; without pg_cron (or when it is installed but not loaded
+-- via shared_preload_libraries) skill_stats() keeps its live aggregate.
+-- Today's count stays live (it only reads today's rows via the created_at
+-- index), so it never lags across midnight.
+create materialized view if not exists mv_skill_forge_stats as
+  select
+    1 as id,
+    count(*) as total,
+    count(*) filter (where validation_passed) as success_count,
+    coalesce(
+      array_agg(distinct domain order by domain) filter (where domain is not null and domain <> ''),
+      '{}'
+    ) as domains
+  from skills;
+
+-- REFRESH ... CONCURRENTLY requires a unique index.
+create unique index if not exists mv_skill_forge_stats_id_idx on mv_skill_forge_stats (id);
+
+create index if not exists skills_created_at_idx on skills (created_at);
+
+do $$
+begin
+  if not exists (select 1 from pg_available_extensions where name = 'pg_cron') then
+    raise notice 'pg_cron not available; skill_stats() keeps its live aggregate.';
+    return;
+  end if;
+
+  begin
+    create extension if not exists pg_cron;
+    perform cron.schedule(
+      'refresh-mv-skill-forge-stats',
+      '*/5 * * * *',
+      'refresh materialized view concurrently mv_skill_forge_stats'
+    );
+  exception when others then
+    raise notice 'pg_cron unavailable (%); skill_stats() keeps its live aggregate.', sqlerrm;
+    return;
+  end;
+
+  execute $fn$
+    create or replace function skill_stats()
+    returns json
+    language sql
+    stable
+    as $body$
+      select json_build_object(
+        'total', mv.total,
+        'today_count', (
+          select count(*) from skills
+          where created_at >= date_trunc('day', now() at time zone 'utc') at time zone 'utc'
+        ),
+        'success_count', mv.success_count,
+        'domains', mv.domains
+      )
+      from mv_skill_forge_stats mv;
+    $body$
+  $fn$;
+end;
+$$;
@@ -0,0 +1,199 @@
+"""Parity tests for the fast frontmatter extractor in forge.skill_manager.
+
+``_fast_frontmatter_fields`` must never accept frontmatter that PyYAML
+rejects, and whenever it answers, the fields it returns must match
+``yaml.safe_load``. Returning None (fall back to YAML) is always allowed.
+"""
+
+from __future__ import annotations
+
+import unittest
+
+import yaml
+
+from forge.skill_manager import (
+    _FAST_FIELDS,
+    _fast_frontmatter_fields,
+    _parse_frontmatter_text,
+    _set_frontmatter_name,
+)
+
+_MISSING = object()
+
+SKILL_FORGE_FRONTMATTER = """\
+name: docker-basics
+description: Build and run containers with Docker.
+license: MIT
+compatibility: Requires docker 24 or newer
+tags:
+  - docker
+  - containers
+metadata:
+  hermes:
+    category: devops
+    version: 1.2
+  skill_forge:
+    domain: docker
+    validation_passed: true
+    sources:
+      - https://docs.docker.com/
+"""
+
+# Valid YAML in the layouts Skill Forge and the sync scripts see.
+VALID_CASES = [
+    SKILL_FORGE_FRONTMATTER,
+    "name: a\ndescription: b\n",
+    "name: a\ndescription: 'it''s quoted: fine'\n",
+    'name: a\ndescription: "double: quoted"\n',
+    "name: a # trailing comment\n",
+    "# leading comment\nname: a\n",
+    "name: a\ntags: [x, y, z]\n",
+    "name: a\ntags: [x, y,]\n",
+    "name: a\ntags:\n- x\n- y\ndescription: d\n",
+    "name: a\nversion: 1.0\n",
+    "name: a\nmetadata:\n  skill_forge:\n    validation_passed: no\n",
+    "name: a\nmetadata:\n    hermes:\n        category: deep\n",
+    "name: a\nmetadata:\n  author:\n    name: Alice\n  hermes:\n    category: c\n",
+    "name: a\nurl: https://example.com/path\n",
+    "name: a\nnote: ratio 3:1\n",
+    "name: 123\n",
+    "name: true\n",
+    "name: ~\n",
+    "name:\n",
+    "name: a\nname: b\n",
+    "name: a\nname:\n  nested: x\n",
+    "name: a\ndescription:\n  - item\n",
+    "other: x\n",
+    "name: a\ndescription: |\n  block\n  text\n",
+    "name: a\ndescription: >\n  folded\n",
+    "name: a\ndescription: first\n  continued\n",
+    "name: &anchor a\ndescription: *anchor\n",
+    "name: a\nmeta: {x: 1}\n",
+    "- a\n- b\n",
+    "name: a\nlist:\n  - 3.11\n  - true\n",
+    # Plain scalars PyYAML resolves to something other than a string.
+    "name: 2024-01-01\n",
+    "name: 2001-12-14t21:59:43.10-05:00\n",
+    "name: 0b101\n",
+    "name: 1:20\n",
+    "name: 190:20:30\n",
+    "name: +.inf\n",
+    "name: 1.\n",
+    "name: 0x_1\n",
+    "name: a\nversion: 2024-01-01\n",
+    "name: a\nmetadata:\n  skill_forge:\n    validation_passed: tRUE\n",
+    "name: a\nmetadata:\n  skill_forge:\n    validation_passed: Yes\n",
+    "name: a\ndescription: 'tab\tquoted'\n",
+]
+
+# Invalid YAML; the fast path must not turn these into a mapping.
+INVALID_CASES = [
+    "name: demo\ncompatibility: Requires python: 3\n",
+    "name: demo\ndescription: Use this skill for:\n",
+    "name: demo\nmetadata:\n  hermes:\n    category: c\n   bad: indent\n",
+    "name: demo\nmetadata:\n    hermes: x\n  bad: indent\n",
+    "name: demo\n  description: over-indented\n",
+    "  name: demo\nname: again\n",
+    "name: demo\ntags:\n  - a\n  b: c\n",
+    "name: demo\ntags:\n  - a\n - b\n",
+    "name: demo\n- stray\n",
+    "name: demo\ntags: [a, b]]\n",
+    "name: demo\ntags: [a,, b]\n",
+    "name: demo\nkey: 'unterminated\n",
+    'name: demo\nkey: "unterminated\n',
+    "name: demo\nkey: {a: 1\n",
+    "name: demo\nkey: - item\n",
+    "name: demo\nkey: ,comma\n",
+    "name: demo\nkey: ]bracket\n",
+    "name: demo\nkey: value: nested\n",
+    "name: demo\nmetadata:\n  skill_forge:\n    domain: x: y\n",
+    "name: a\n\tdescription: tab\n",
+    "name: =\n",
+    "name: <<\n",
+    "name: demo\ntags: [a, =]\n",
+    "name: a\t# c\n",
+    "name: demo\ndescription: b\t# comment\n",
+    "name: demo\ncreated: 2024-13-45\n",
+]
+
+
+def _get(mapping, path):
+    """Return the value at a nested key path, or _MISSING."""
+    node = mapping
+    for part in path:
+        if not isinstance(node, dict) or part not in node:
+            return _MISSING
+        node = node[part]
+    return node
+
+
+def _safe_load(text):
+    try:
+        return yaml.safe_load(text)
+    except (yaml.YAMLError, ValueError):  # ValueError: out-of-range dates
+        return _MISSING
+
+
+class FastFrontmatterParityTests(unittest.TestCase):
+    def assert_parity(self, text):
+        fast = _fast_frontmatter_fields(text)
+        if fast is None:
+            return
+        expected = _safe_load(text)
+        self.assertIsNot(expected, _MISSING, f"fast path accepted invalid YAML:\n{text}")
+        self.assertIsInstance(expected, dict, text)
+        for path in _FAST_FIELDS:
+            want = _get(expected, path)
+            if want is None:
+                want = _MISSING  # an empty value yields no field on the fast path
+            got = _get(fast, path)
+            self.assertEqual(got, want, f"{'.'.join(path)} differs for:\n{text}")
+            self.assertIs(type(got), type(want), f"{'.'.join(path)} type differs for:\n{text}")
+
+    def test_valid_cases_match_yaml(self):
+        for text in VALID_CASES:
+            with self.subTest(text=text):
+                self.assertIsNot(_safe_load(text), _MISSING, "test case must be valid YAML")
+                self.assert_parity(text)
+
+    def test_invalid_cases_fall_back(self):
+        for text in INVALID_CASES:
+            with self.subTest(text=text):
+                self.assertIs(_safe_load(text), _MISSING, "test case must be invalid YAML")
+                self.assertIsNone(_fast_frontmatter_fields(text))
+
+    def test_skill_forge_layout_takes_fast_path(self):
+        self.assertEqual(
+            _fast_frontmatter_fields(SKILL_FORGE_FRONTMATTER),
+            {
+                "name": "docker-basics",
+                "description": "Build and run containers with Docker.",
+                "metadata": {
+                    "hermes": {"category": "devops"},
+                    "skill_forge": {"domain": "docker", "validation_passed": True},
+                },
+            },
+        )
+
+    def test_invalid_draft_has_no_name(self):
+        draft = (
+            "---\nname: demo\ndescription: Deploy apps with this skill:\n"
+            "compatibility: Requires python: 3.11\n---\n# Demo\n"
+        )
+        self.assertNotIn("name", _parse_frontmatter_text(draft))
+
+
+class SetFrontmatterNameTests(unittest.TestCase):
+    def test_rewrites_top_level_name_only(self):
+        content = "---\nmetadata:\n  author:\n    name: Alice\nname: wrong\n---\nname: body\n"
+        self.assertEqual(
+            _set_frontmatter_name(content, "right"),
+            "---\nmetadata:\n  author:\n    name: Alice\nname: right\n---\nname: body\n",
+        )
+
+    def test_without_frontmatter_is_unchanged(self):
+        self.assertEqual(_set_frontmatter_name("# no frontmatter\n", "x"), "# no frontmatter\n")
+
+
+if __name__ == "__main__":
+    unittest.main()